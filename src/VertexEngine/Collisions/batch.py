@@ -0,0 +1,201 @@
+"""Collision tests between whole sets of shapes at once, with NumPy (needs `numpy`).
+
+Shapes are passed as arrays with one row per shape (or as lists of colliders, which are turned
+into arrays with the `*_array` functions):
+- circles: `(n, 3)` of `x, y, radius`
+- AABBs: `(n, 4)` of `min_x, min_y, max_x, max_y`
+- boxes (rotated rects): `(n, 6)` of `x, y, half_width, half_height, cos(angle), sin(angle)`
+
+Every test has a `*_pairs(a, b)` version returning an `(k, 2)` array of `(index in a, index in b)`
+for every overlap, and a `*_any(a, b)` version returning a boolean mask of the shapes in `a`
+that overlap anything in `b`. With `b=None`, `*_pairs` tests `a` against itself and returns
+every pair once, with `i < j`.
+
+The math is done in the same order as the colliders' own tests, so the results are exactly
+the same as calling `collides_with` on every pair.
+
+Work is split into chunks of at most `max_elements` shape pairs, so memory stays bounded.
+
+``` python
+enemies = circles_array(enemy_colliders)
+bullets = circles_array(bullet_colliders)
+for enemy, bullet in circle_pairs(enemies, bullets):
+    ...
+```
+"""
+import numpy as np
+
+from .collisions import Circle, RotatedCollider
+
+# Shape pairs tested per chunk, bounds the size of the temporary arrays
+MAX_ELEMENTS = 1 << 20
+
+
+def circles_array(circles):
+    """Return the `(n, 3)` array of a list of `Circle`s."""
+    return np.array([(c.x, c.y, c.radius) for c in circles], float).reshape(-1, 3)
+
+
+def aabbs_array(colliders):
+    """Return the `(n, 4)` array of the AABBs of any colliders."""
+    return np.array([c.aabb() for c in colliders], float).reshape(-1, 4)
+
+
+def boxes_array(rects):
+    """Return the `(n, 6)` array of a list of `RotatedCollider`s."""
+    return np.array([(r._x, r._y, r._width / 2, r._height / 2, r._cos, r._sin) for r in rects], float).reshape(-1, 6)
+
+
+def _as_array(shapes, columns, convert):
+    if isinstance(shapes, np.ndarray):
+        return shapes.reshape(-1, columns).astype(float, copy=False)
+    return convert(shapes)
+
+
+# ---------------------- TESTS ----------------------
+# Each one takes `a` as `(m, 1, columns)` and `b` as `(1, n, columns)` and returns an `(m, n)` mask
+
+def _circle_circle(a, b):
+    dx = a[..., 0] - b[..., 0]
+    dy = a[..., 1] - b[..., 1]
+    radius_sum = a[..., 2] + b[..., 2]
+    return dx*dx + dy*dy <= radius_sum * radius_sum
+
+
+def _aabb_aabb(a, b):
+    return ~((a[..., 0] > b[..., 2]) | (b[..., 0] > a[..., 2]) | (a[..., 1] > b[..., 3]) | (b[..., 1] > a[..., 3]))
+
+
+def _box_box(a, b):
+    dx, dy = b[..., 0] - a[..., 0], b[..., 1] - a[..., 1]
+    a_w, a_h, a_cos, a_sin = a[..., 2], a[..., 3], a[..., 4], a[..., 5]
+    b_w, b_h, b_cos, b_sin = b[..., 2], b[..., 3], b[..., 4], b[..., 5]
+
+    c, s = a_cos*b_cos + a_sin*b_sin, a_cos*b_sin - a_sin*b_cos
+    abs_c, abs_s = np.abs(c), np.abs(s)
+
+    separated = np.abs(dx*a_cos + dy*a_sin) > a_w + b_w*abs_c + b_h*abs_s
+    separated |= np.abs(-dx*a_sin + dy*a_cos) > a_h + b_w*abs_s + b_h*abs_c
+    separated |= np.abs(dx*b_cos + dy*b_sin) > b_w + a_w*abs_c + a_h*abs_s
+    separated |= np.abs(-dx*b_sin + dy*b_cos) > b_h + a_w*abs_s + a_h*abs_c
+    return ~separated
+
+
+def _box_circle(a, b):
+    dx, dy = b[..., 0] - a[..., 0], b[..., 1] - a[..., 1]
+    cos_a, sin_a = a[..., 4], a[..., 5]
+    local_x, local_y = dx*cos_a + dy*sin_a, -dx*sin_a + dy*cos_a
+    half_w, half_h = a[..., 2], a[..., 3]
+    off_x = local_x - np.maximum(-half_w, np.minimum(half_w, local_x))
+    off_y = local_y - np.maximum(-half_h, np.minimum(half_h, local_y))
+    radius = b[..., 2]
+    return off_x*off_x + off_y*off_y <= radius * radius
+
+
+# ---------------------- CHUNKING ----------------------
+
+def _chunks(a, b, max_elements):
+    """Yield `(a_start, b_start, rows of a, rows of b)` shaped for broadcasting, so every chunk tests at most `max_elements` pairs."""
+    # Optimized: b is only split when a single row of a against all of it would be too big
+    b_rows = max(1, min(len(b), max_elements))
+    a_rows = max(1, max_elements // b_rows)
+    for b_start in range(0, len(b), b_rows):
+        others = b[None, b_start:b_start + b_rows, :]
+        for a_start in range(0, len(a), a_rows):
+            yield a_start, b_start, a[a_start:a_start + a_rows, None, :], others
+
+
+def _pairs(test, a, b, max_elements):
+    self_test = b is None
+    if self_test:
+        b = a
+    found = []
+    for a_start, b_start, chunk, others in _chunks(a, b, max_elements):
+        mask = test(chunk, others)
+        if self_test:
+            # Only pairs with i < j, so every pair is reported once and nothing with itself
+            mask &= (np.arange(a_start, a_start + mask.shape[0])[:, None]
+                     < np.arange(b_start, b_start + mask.shape[1])[None, :])
+        i, j = np.nonzero(mask)
+        found.append(np.stack((i + a_start, j + b_start), axis=1))
+    if not found:
+        return np.zeros((0, 2), np.intp)
+    return np.concatenate(found)
+
+
+def _any(test, a, b, max_elements):
+    hits = np.zeros(len(a), bool)
+    for a_start, _, chunk, others in _chunks(a, b, max_elements):
+        hits[a_start:a_start + len(chunk)] |= test(chunk, others).any(axis=1)
+    return hits
+
+
+# ---------------------- PUBLIC ----------------------
+
+def circle_pairs(a, b=None, max_elements=MAX_ELEMENTS):
+    """Overlapping circles, same result as `Circle.collides_with(Circle)`."""
+    a = _as_array(a, 3, circles_array)
+    b = None if b is None else _as_array(b, 3, circles_array)
+    return _pairs(_circle_circle, a, b, max_elements)
+
+
+def circle_any(a, b, max_elements=MAX_ELEMENTS):
+    return _any(_circle_circle, _as_array(a, 3, circles_array), _as_array(b, 3, circles_array), max_elements)
+
+
+def aabb_pairs(a, b=None, max_elements=MAX_ELEMENTS):
+    """Overlapping AABBs (touching counts as overlapping)."""
+    a = _as_array(a, 4, aabbs_array)
+    b = None if b is None else _as_array(b, 4, aabbs_array)
+    return _pairs(_aabb_aabb, a, b, max_elements)
+
+
+def aabb_any(a, b, max_elements=MAX_ELEMENTS):
+    return _any(_aabb_aabb, _as_array(a, 4, aabbs_array), _as_array(b, 4, aabbs_array), max_elements)
+
+
+def box_pairs(a, b=None, max_elements=MAX_ELEMENTS):
+    """Overlapping rotated rects (SAT), same result as `RotatedCollider.collides_with(RotatedCollider)`."""
+    a = _as_array(a, 6, boxes_array)
+    b = None if b is None else _as_array(b, 6, boxes_array)
+    return _pairs(_box_box, a, b, max_elements)
+
+
+def box_any(a, b, max_elements=MAX_ELEMENTS):
+    return _any(_box_box, _as_array(a, 6, boxes_array), _as_array(b, 6, boxes_array), max_elements)
+
+
+def box_circle_pairs(boxes, circles, max_elements=MAX_ELEMENTS):
+    """Rotated rects overlapping circles, same result as `RotatedCollider.collides_with(Circle)`."""
+    return _pairs(_box_circle, _as_array(boxes, 6, boxes_array), _as_array(circles, 3, circles_array), max_elements)
+
+
+def box_circle_any(boxes, circles, max_elements=MAX_ELEMENTS):
+    return _any(_box_circle, _as_array(boxes, 6, boxes_array), _as_array(circles, 3, circles_array), max_elements)
+
+
+def collider_pairs(a, b=None, max_elements=MAX_ELEMENTS):
+    """Overlapping pairs of two lists of colliders of one kind each (`Circle`s or `RotatedCollider`s).
+    Raises `TypeError` for any other kind of collider."""
+    if not len(a) or (b is not None and not len(b)):
+        return np.zeros((0, 2), np.intp)
+    kind_a = _kind(a)
+    kind_b = kind_a if b is None else _kind(b)
+    if kind_a is Circle and kind_b is Circle:
+        return circle_pairs(a, b, max_elements)
+    if kind_a is RotatedCollider and kind_b is RotatedCollider:
+        return box_pairs(a, b, max_elements)
+    if kind_a is RotatedCollider and kind_b is Circle:
+        return box_circle_pairs(a, b, max_elements)
+    if kind_a is Circle and kind_b is RotatedCollider:
+        return box_circle_pairs(b, a, max_elements)[:, ::-1]
+    raise TypeError(f"collider_pairs only supports Circle and RotatedCollider, not "
+                    f"{kind_a.__name__} and {kind_b.__name__}")
+
+
+def _kind(colliders):
+    kinds = {Circle if isinstance(c, Circle) else RotatedCollider if isinstance(c, RotatedCollider) else type(c)
+             for c in colliders}
+    if len(kinds) != 1:
+        raise ValueError("Every collider of a batch must be a Circle, or every one a RotatedCollider")
+    return kinds.pop()
@@ -2,132 +2,597 @@ import math
 
 class Collider:
     """Base class for all colliders"""
+    # Subclasses list their fields in `__slots__` for fast access, "__dict__" still lets games attach
+    # their own attributes (`collider.owner = enemy`)
+    __slots__ = ("__dict__", "__weakref__")
+
     def collides_with(self, other):
         """Polymorphic collision detection"""
-        method_name = f"_collides_with_{type(other).__name__.lower()}"
-        if hasattr(self, method_name):
-            return getattr(self, method_name)(other)
-        # fallback: try the other object
-        method_name = f"_collides_with_{type(self).__name__.lower()}"
-        if hasattr(other, method_name):
-            return getattr(other, method_name)(self)
-        raise NotImplementedError(f"Collision not implemented between {type(self)} and {type(other)}")
-    
+        # Optimized: One dict lookup on the pair of types instead of building method names
+        test = _DISPATCH.get((type(self), type(other)))
+        if test is None:
+            test = _resolve(type(self), type(other))
+        return test(self, other)
+
+    def contact(self, other):
+        """Return a `Contact` describing how `self` and `other` overlap, or None if they don't collide.
+        Its normal points from `self` to `other`."""
+        test = _CONTACTS.get((type(self), type(other)))
+        if test is None:
+            test = _resolve_contact(type(self), type(other))
+        return test(self, other)
+
+    def aabb(self):
+        """Return the axis-aligned bounding box as `(min_x, min_y, max_x, max_y)`."""
+        raise NotImplementedError
+
+class Contact:
+    """How two colliders overlap, returned by `Collider.contact()`.
+    `normal` is the unit direction from the first collider to the second
+    `depth` is how far they overlap along `normal`
+    `points` are the contact points in world space (one or two)
+
+    Moving the second collider by `mtv` (or the first by minus `mtv`) separates them."""
+    __slots__ = ("normal", "depth", "points")
+
+    def __init__(self, normal, depth, points):
+        self.normal = normal
+        self.depth = depth
+        self.points = points
+
+    @property
+    def mtv(self):
+        """Minimum translation vector, `normal * depth`."""
+        return self.normal[0] * self.depth, self.normal[1] * self.depth
+
+    def flipped(self):
+        """The same contact seen from the other collider."""
+        return Contact((-self.normal[0], -self.normal[1]), self.depth, self.points)
+
+    def __repr__(self):
+        return f"Contact(normal={self.normal}, depth={self.depth}, points={self.points})"
+
 class Polygon(Collider):
-    """Polygon collider allows you to draw a collider between 3 and 4 points."""
+    """Polygon collider allows you to draw a collider between 3 and 4 points.
+
+    `points` is copied into a tuple of `(x, y)` tuples, so it can't be changed in place: assign a
+    new list of points to move the polygon. Edge normals and the AABB are cached until then."""
+    __slots__ = ("_points", "_normals_cache", "_aabb")
+
     def __init__(self, points):
         assert 3 <= len(points) <= 4, "Only triangles and quads supported"
         self.points = points
 
+    @property
+    def points(self):
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        self._points = tuple((pt[0], pt[1]) for pt in points)
+        self.invalidate()
+
+    def invalidate(self):
+        """Forget the cached edge normals and AABB."""
+        self._normals_cache = None
+        self._aabb = None
+
+    def aabb(self):
+        if self._aabb is None:
+            xs = [pt[0] for pt in self._points]
+            ys = [pt[1] for pt in self._points]
+            self._aabb = (min(xs), min(ys), max(xs), max(ys))
+        return self._aabb
+
+    def _corners(self):
+        return self._points
+
     def _edges(self):
         return [(self.points[i], self.points[(i+1) % len(self.points)]) for i in range(len(self.points))]
 
     def _normals(self):
+        if self._normals_cache is not None:
+            return self._normals_cache
         normals = []
         for p1, p2 in self._edges():
             edge = (p2[0]-p1[0], p2[1]-p1[1])
             normal = (-edge[1], edge[0])
             length = math.hypot(*normal)
             normals.append((normal[0]/length, normal[1]/length))
+        self._normals_cache = normals
         return normals
 
+    # The SAT axes of a polygon are its edge normals
+    _axes = _normals
+
     def _project_onto_axis(self, axis):
-        dots = [pt[0]*axis[0] + pt[1]*axis[1] for pt in self.points]
-        return min(dots), max(dots)
+        return _project(self._corners(), axis)
 
     def _collides_with_polygon(self, other):
-        axes = self._normals() + other._normals()
-        for axis in axes:
-            min1, max1 = self._project_onto_axis(axis)
-            min2, max2 = other._project_onto_axis(axis)
-            if max1 < min2 or max2 < min1:
-                return False
-        return True
+        return _convex_convex(self, other)
+
+    def _collides_with_rotatedcollider(self, rect):
+        return _convex_convex(self, rect)
 
     def _collides_with_circle(self, circle):
-        for i in range(len(self.points)):
-            p1, p2 = self.points[i], self.points[(i+1) % len(self.points)]
-            # Closest point on edge to circle center
-            dx, dy = p2[0]-p1[0], p2[1]-p1[1]
-            t = max(0, min(1, ((circle.x - p1[0])*dx + (circle.y - p1[1])*dy)/(dx*dx + dy*dy)))
-            closest = (p1[0] + t*dx, p1[1] + t*dy)
-            dist_sq = (circle.x - closest[0])**2 + (circle.y - closest[1])**2
-            if dist_sq <= circle.radius**2:
-                return True
-        # Also check if circle inside polygon
-        if self._point_inside(circle.x, circle.y):
-            return True
-        return False
+        return _convex_circle(self, circle)
 
     def _point_inside(self, px, py):
-        # Ray-casting algorithm
-        inside = False
-        n = len(self.points)
-        xints = 0
-        p1x, p1y = self.points[0]
-        for i in range(n+1):
-            p2x, p2y = self.points[i % n]
-            if py > min(p1y,p2y):
-                if py <= max(p1y,p2y):
-                    if px <= max(p1x,p2x):
-                        if p1y != p2y:
-                            xints = (py-p1y)*(p2x-p1x)/(p2y-p1y)+p1x
-                        if p1x == p2x or px <= xints:
-                            inside = not inside
-            p1x,p1y = p2x,p2y
-        return inside
-    
+        return _point_inside(self._corners(), px, py)
+
 class Circle(Collider):
     """This is the collider for a circle.
     `x` is the x axis of the position of the collider
     `y` is the y axis of the position of the collider
     `radius` is the radius of the collider"""
+    __slots__ = ("x", "y", "radius")
+
     def __init__(self, x, y, radius):
         self.x = x
         self.y = y
         self.radius = radius
 
+    def aabb(self):
+        r = self.radius
+        return self.x - r, self.y - r, self.x + r, self.y + r
+
     def _collides_with_circle(self, other):
-        dx = self.x - other.x
-        dy = self.y - other.y
-        distance_sq = dx*dx + dy*dy
-        radius_sum = self.radius + other.radius
-        return distance_sq <= radius_sum * radius_sum
+        return _circle_circle(self, other)
 
     def _collides_with_rotatedcollider(self, rect):
-        # Approximate rectangle as polygon for SAT
-        poly = Polygon(rect.get_corners())
-        return poly._collides_with_circle(self)
-    
+        return _rect_circle(rect, self)
+
 class RotatedCollider(Collider):
     """This is an `ACCURATE HITBOX` for more advanced collisions.
     This is a rect collider, as it's simpler.
-    The reason I can't do polygons like triangles because it uses more cpu and gpu to calculate the points, as you have to take in rotation matrices, and more."""
+    The reason I can't do polygons like triangles because it uses more cpu and gpu to calculate the points, as you have to take in rotation matrices, and more.
+
+    Corners, axes and the AABB are cached. Moving only recomputes the corners, the sine and
+    cosine are only recomputed when `angle` changes."""
+    __slots__ = ("_x", "_y", "_width", "_height", "_angle", "_cos", "_sin", "_corners_cache", "_aabb")
+
     def __init__(self, x, y, width, height, angle=0):
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
+        self._x = x
+        self._y = y
+        self._width = width
+        self._height = height
         self.angle = angle  # in degrees
 
+    # Every setter marks the cached corners and AABB dirty
+    @property
+    def x(self):
+        return self._x
+
+    @x.setter
+    def x(self, value):
+        self._x = value
+        self._corners_cache = self._aabb = None
+
+    @property
+    def y(self):
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        self._y = value
+        self._corners_cache = self._aabb = None
+
+    @property
+    def width(self):
+        return self._width
+
+    @width.setter
+    def width(self, value):
+        self._width = value
+        self._corners_cache = self._aabb = None
+
+    @property
+    def height(self):
+        return self._height
+
+    @height.setter
+    def height(self, value):
+        self._height = value
+        self._corners_cache = self._aabb = None
+
+    @property
+    def angle(self):
+        return self._angle
+
+    @angle.setter
+    def angle(self, value):
+        self._angle = value
+        rad = math.radians(value)
+        self._cos, self._sin = math.cos(rad), math.sin(rad)
+        self._corners_cache = self._aabb = None
+
+    def move_to(self, x, y, angle=None):
+        """Set the position (and angle) at once."""
+        self._x, self._y = x, y
+        if angle is not None and angle != self._angle:
+            self.angle = angle
+        else:
+            self._corners_cache = self._aabb = None
+
+    def aabb(self):
+        if self._aabb is None:
+            # Half extents of the turned rect, without building its corners
+            cos_a, sin_a = abs(self._cos), abs(self._sin)
+            ex = (self._width * cos_a + self._height * sin_a) / 2
+            ey = (self._width * sin_a + self._height * cos_a) / 2
+            self._aabb = (self._x - ex, self._y - ey, self._x + ex, self._y + ey)
+        return self._aabb
+
     def get_corners(self):
-        cx, cy = self.x, self.y
-        w, h = self.width/2, self.height/2
-        rad = math.radians(self.angle)
-        cos_a, sin_a = math.cos(rad), math.sin(rad)
-        corners = []
-        for dx, dy in [(-w, -h), (w, -h), (w, h), (-w, h)]:
-            x_rot = cx + dx * cos_a - dy * sin_a
-            y_rot = cy + dx * sin_a + dy * cos_a
-            corners.append((x_rot, y_rot))
+        return list(self._corners())
+
+    def _corners(self):
+        corners = self._corners_cache
+        if corners is None:
+            cx, cy = self._x, self._y
+            cos_a, sin_a = self._cos, self._sin
+            # Half width and height along the rect's own axes
+            wx, wy = self._width / 2 * cos_a, self._width / 2 * sin_a
+            hx, hy = -self._height / 2 * sin_a, self._height / 2 * cos_a
+            corners = self._corners_cache = (
+                (cx - wx - hx, cy - wy - hy),
+                (cx + wx - hx, cy + wy - hy),
+                (cx + wx + hx, cy + wy + hy),
+                (cx - wx + hx, cy - wy + hy),
+            )
         return corners
 
+    def _axes(self):
+        # Opposite edges of a rect are parallel, two axes are enough for SAT
+        return ((self._cos, self._sin), (-self._sin, self._cos))
+
+    def _project_onto_axis(self, axis):
+        return _project(self._corners(), axis)
+
     def _collides_with_rotatedcollider(self, other):
-        poly1 = Polygon(self.get_corners())
-        poly2 = Polygon(other.get_corners())
-        return poly1._collides_with_polygon(poly2)
+        return _rect_rect(self, other)
+
+    def _collides_with_polygon(self, polygon):
+        return _convex_convex(self, polygon)
 
     def _collides_with_circle(self, circle):
-        poly = Polygon(self.get_corners())
-        return poly._collides_with_circle(circle)
-    
\ No newline at end of file
+        return _rect_circle(self, circle)
+
+# ---------------------- NARROWPHASE ----------------------
+# Polygons and rotated rects are both convex shapes with `_corners()` and `_axes()`
+
+def _project(points, axis):
+    ax, ay = axis
+    dots = [x*ax + y*ay for x, y in points]
+    return min(dots), max(dots)
+
+def _convex_convex(a, b):
+    points_a, points_b = a._corners(), b._corners()
+    for axes in (a._axes(), b._axes()):
+        for axis in axes:
+            min1, max1 = _project(points_a, axis)
+            min2, max2 = _project(points_b, axis)
+            if max1 < min2 or max2 < min1:
+                return False
+    return True
+
+def _convex_circle(shape, circle):
+    points = shape._corners()
+    cx, cy, r_sq = circle.x, circle.y, circle.radius * circle.radius
+    n = len(points)
+    for i in range(n):
+        p1, p2 = points[i], points[(i+1) % n]
+        # Closest point on edge to circle center
+        dx, dy = p2[0]-p1[0], p2[1]-p1[1]
+        t = max(0, min(1, ((cx - p1[0])*dx + (cy - p1[1])*dy)/(dx*dx + dy*dy)))
+        closest_x, closest_y = p1[0] + t*dx, p1[1] + t*dy
+        if (cx - closest_x)**2 + (cy - closest_y)**2 <= r_sq:
+            return True
+    # Also check if circle inside polygon
+    return _point_inside(points, cx, cy)
+
+def _rect_rect(a, b):
+    # SAT for two rects straight from centers and half sizes, no corners needed
+    dx, dy = b._x - a._x, b._y - a._y
+    a_cos, a_sin, b_cos, b_sin = a._cos, a._sin, b._cos, b._sin
+    a_w, a_h, b_w, b_h = a._width / 2, a._height / 2, b._width / 2, b._height / 2
+
+    # cos/sin of the angle between the two rects' axes
+    c, s = a_cos*b_cos + a_sin*b_sin, a_cos*b_sin - a_sin*b_cos
+    abs_c, abs_s = abs(c), abs(s)
+
+    # a's axes
+    if abs(dx*a_cos + dy*a_sin) > a_w + b_w*abs_c + b_h*abs_s:
+        return False
+    if abs(-dx*a_sin + dy*a_cos) > a_h + b_w*abs_s + b_h*abs_c:
+        return False
+    # b's axes
+    if abs(dx*b_cos + dy*b_sin) > b_w + a_w*abs_c + a_h*abs_s:
+        return False
+    if abs(-dx*b_sin + dy*b_cos) > b_h + a_w*abs_s + a_h*abs_c:
+        return False
+    return True
+
+def _rect_circle(rect, circle):
+    # Circle center in the rect's own frame, then the closest point of the rect is a clamp
+    dx, dy = circle.x - rect._x, circle.y - rect._y
+    cos_a, sin_a = rect._cos, rect._sin
+    local_x, local_y = dx*cos_a + dy*sin_a, -dx*sin_a + dy*cos_a
+    half_w, half_h = rect._width / 2, rect._height / 2
+    off_x = local_x - max(-half_w, min(half_w, local_x))
+    off_y = local_y - max(-half_h, min(half_h, local_y))
+    return off_x*off_x + off_y*off_y <= circle.radius * circle.radius
+
+def _circle_rect(circle, rect):
+    return _rect_circle(rect, circle)
+
+def _circle_convex(circle, shape):
+    return _convex_circle(shape, circle)
+
+def _circle_circle(a, b):
+    dx = a.x - b.x
+    dy = a.y - b.y
+    radius_sum = a.radius + b.radius
+    return dx*dx + dy*dy <= radius_sum * radius_sum
+
+def _point_inside(points, px, py):
+    # Ray-casting algorithm
+    inside = False
+    n = len(points)
+    xints = 0
+    p1x, p1y = points[0]
+    for i in range(n+1):
+        p2x, p2y = points[i % n]
+        if py > min(p1y,p2y):
+            if py <= max(p1y,p2y):
+                if px <= max(p1x,p2x):
+                    if p1y != p2y:
+                        xints = (py-p1y)*(p2x-p1x)/(p2y-p1y)+p1x
+                    if p1x == p2x or px <= xints:
+                        inside = not inside
+        p1x,p1y = p2x,p2y
+    return inside
+
+# ---------------------- CONTACTS ----------------------
+# Same tests as above, but they keep what they found to build a `Contact`
+
+def _center(points):
+    n = len(points)
+    return sum(p[0] for p in points) / n, sum(p[1] for p in points) / n
+
+def _convex_convex_contact(a, b):
+    points_a, points_b = a._corners(), b._corners()
+    depth, normal = None, None
+    for axes in (a._axes(), b._axes()):
+        for axis in axes:
+            min1, max1 = _project(points_a, axis)
+            min2, max2 = _project(points_b, axis)
+            if max1 < min2 or max2 < min1:
+                return None
+            # Optimized: The projections SAT already made give the overlap on this axis for free,
+            # and which side b is on: pushing it along the axis or against it
+            forward, backward = max1 - min2, max2 - min1
+            if depth is None or forward < depth:
+                depth, normal = forward, axis
+            if backward < depth:
+                depth, normal = backward, (-axis[0], -axis[1])
+    return Contact(normal, depth, _clip_points(points_a, points_b, normal))
+
+def _best_edge(points, nx, ny):
+    """The edge of `points` most facing the direction `nx`, `ny`, as `(v1, v2)`."""
+    n = len(points)
+    best = max(range(n), key=lambda i: points[i][0]*nx + points[i][1]*ny)
+    v, prev, nxt = points[best], points[best - 1], points[(best + 1) % n]
+    # Of the two edges at the farthest vertex, the one most perpendicular to the direction
+    lx, ly = v[0] - prev[0], v[1] - prev[1]
+    rx, ry = nxt[0] - v[0], nxt[1] - v[1]
+    left = abs(lx*nx + ly*ny) / (math.hypot(lx, ly) or 1)
+    right = abs(rx*nx + ry*ny) / (math.hypot(rx, ry) or 1)
+    return (prev, v) if left <= right else (v, nxt)
+
+def _clip_points(points_a, points_b, normal):
+    """Contact points of two overlapping convex shapes: the incident edge clipped to the reference edge."""
+    nx, ny = normal
+    edge_a = _best_edge(points_a, nx, ny)
+    edge_b = _best_edge(points_b, -nx, -ny)
+
+    def facing(edge):
+        ex, ey = edge[1][0] - edge[0][0], edge[1][1] - edge[0][1]
+        return abs(ex*nx + ey*ny) / (math.hypot(ex, ey) or 1)
+
+    # The reference edge is the one most perpendicular to the normal, its face points along `ref_n`
+    if facing(edge_a) <= facing(edge_b):
+        ref, inc, ref_nx, ref_ny = edge_a, edge_b, nx, ny
+    else:
+        ref, inc, ref_nx, ref_ny = edge_b, edge_a, -nx, -ny
+
+    ex, ey = ref[1][0] - ref[0][0], ref[1][1] - ref[0][1]
+    length = math.hypot(ex, ey) or 1
+    ex, ey = ex / length, ey / length
+
+    # Cut the incident edge to the sides of the reference edge
+    clipped = list(inc)
+    for offset, sign in ((ex*ref[0][0] + ey*ref[0][1], 1), (ex*ref[1][0] + ey*ref[1][1], -1)):
+        p1, p2 = clipped
+        d1 = sign * (ex*p1[0] + ey*p1[1] - offset)
+        d2 = sign * (ex*p2[0] + ey*p2[1] - offset)
+        if d1 < 0 and d2 < 0:
+            break
+        if d1 < 0 or d2 < 0:
+            t = d1 / (d1 - d2)
+            cut = (p1[0] + t*(p2[0] - p1[0]), p1[1] + t*(p2[1] - p1[1]))
+            clipped = [cut, p2] if d1 < 0 else [p1, cut]
+    else:
+        # Only points behind the reference face touch it
+        face = ref_nx*ref[0][0] + ref_ny*ref[0][1]
+        points = [p for p in clipped if ref_nx*p[0] + ref_ny*p[1] - face <= 1e-9]
+        if points:
+            return points
+
+    # Corner against corner or so thin nothing is left after clipping: the deepest incident point
+    return [min(inc, key=lambda p: ref_nx*p[0] + ref_ny*p[1])]
+
+def _convex_circle_contact(shape, circle):
+    points = shape._corners()
+    cx, cy, r = circle.x, circle.y, circle.radius
+    n = len(points)
+    best_sq, closest, edge = None, None, None
+    for i in range(n):
+        p1, p2 = points[i], points[(i+1) % n]
+        dx, dy = p2[0]-p1[0], p2[1]-p1[1]
+        t = max(0, min(1, ((cx - p1[0])*dx + (cy - p1[1])*dy)/(dx*dx + dy*dy)))
+        closest_x, closest_y = p1[0] + t*dx, p1[1] + t*dy
+        dist_sq = (cx - closest_x)**2 + (cy - closest_y)**2
+        if best_sq is None or dist_sq < best_sq:
+            best_sq, closest, edge = dist_sq, (closest_x, closest_y), (dx, dy)
+
+    inside = _point_inside(points, cx, cy)
+    if not inside and best_sq > r * r:
+        return None
+
+    dist = math.sqrt(best_sq)
+    if dist:
+        nx, ny = (cx - closest[0]) / dist, (cy - closest[1]) / dist
+    else:
+        # Center right on an edge: use the edge's normal
+        length = math.hypot(*edge)
+        nx, ny = -edge[1] / length, edge[0] / length
+        inside = False
+    if inside:
+        # The center is past the edge, push it back out through it
+        return Contact((-nx, -ny), r + dist, [closest])
+    sx, sy = _center(points)
+    if not dist and (cx - sx)*nx + (cy - sy)*ny < 0:
+        nx, ny = -nx, -ny
+    return Contact((nx, ny), r - dist, [closest])
+
+def _rect_circle_contact(rect, circle):
+    # Same clamp as `_rect_circle`, in the rect's own frame
+    dx, dy = circle.x - rect._x, circle.y - rect._y
+    cos_a, sin_a = rect._cos, rect._sin
+    local_x, local_y = dx*cos_a + dy*sin_a, -dx*sin_a + dy*cos_a
+    half_w, half_h = rect._width / 2, rect._height / 2
+    near_x = max(-half_w, min(half_w, local_x))
+    near_y = max(-half_h, min(half_h, local_y))
+    off_x, off_y = local_x - near_x, local_y - near_y
+    dist_sq = off_x*off_x + off_y*off_y
+    r = circle.radius
+    if dist_sq > r * r:
+        return None
+
+    if dist_sq:
+        dist = math.sqrt(dist_sq)
+        n_x, n_y, depth = off_x / dist, off_y / dist, r - dist
+    else:
+        # Center inside the rect: leave through the nearest side
+        gap_x, gap_y = half_w - abs(local_x), half_h - abs(local_y)
+        if gap_x < gap_y:
+            n_x, n_y, depth = (1.0 if local_x >= 0 else -1.0), 0.0, r + gap_x
+            near_x = half_w if local_x >= 0 else -half_w
+        else:
+            n_x, n_y, depth = 0.0, (1.0 if local_y >= 0 else -1.0), r + gap_y
+            near_y = half_h if local_y >= 0 else -half_h
+
+    # Back to world space
+    normal = (n_x*cos_a - n_y*sin_a, n_x*sin_a + n_y*cos_a)
+    point = (rect._x + near_x*cos_a - near_y*sin_a, rect._y + near_x*sin_a + near_y*cos_a)
+    return Contact(normal, depth, [point])
+
+def _circle_rect_contact(circle, rect):
+    contact = _rect_circle_contact(rect, circle)
+    return contact and contact.flipped()
+
+def _circle_convex_contact(circle, shape):
+    contact = _convex_circle_contact(shape, circle)
+    return contact and contact.flipped()
+
+def _circle_circle_contact(a, b):
+    dx = b.x - a.x
+    dy = b.y - a.y
+    radius_sum = a.radius + b.radius
+    dist_sq = dx*dx + dy*dy
+    if dist_sq > radius_sum * radius_sum:
+        return None
+    dist = math.sqrt(dist_sq)
+    # Same centers: any direction separates them
+    nx, ny = (dx / dist, dy / dist) if dist else (1.0, 0.0)
+    return Contact((nx, ny), radius_sum - dist, [(a.x + nx*a.radius, a.y + ny*a.radius)])
+
+# (type of self, type of other) -> test function
+_DISPATCH = {
+    (Polygon, Polygon): _convex_convex,
+    (Polygon, RotatedCollider): _convex_convex,
+    (RotatedCollider, Polygon): _convex_convex,
+    (RotatedCollider, RotatedCollider): _rect_rect,
+    (Polygon, Circle): _convex_circle,
+    (RotatedCollider, Circle): _rect_circle,
+    (Circle, Polygon): _circle_convex,
+    (Circle, RotatedCollider): _circle_rect,
+    (Circle, Circle): _circle_circle,
+}
+
+# (type of self, type of other) -> contact function
+_CONTACTS = {
+    (Polygon, Polygon): _convex_convex_contact,
+    (Polygon, RotatedCollider): _convex_convex_contact,
+    (RotatedCollider, Polygon): _convex_convex_contact,
+    (RotatedCollider, RotatedCollider): _convex_convex_contact,
+    (Polygon, Circle): _convex_circle_contact,
+    (RotatedCollider, Circle): _rect_circle_contact,
+    (Circle, Polygon): _circle_convex_contact,
+    (Circle, RotatedCollider): _circle_rect_contact,
+    (Circle, Circle): _circle_circle_contact,
+}
+
+def _lookup_bases(table, type_a, type_b):
+    for base_a in type_a.__mro__:
+        for base_b in type_b.__mro__:
+            test = table.get((base_a, base_b))
+            if test is not None:
+                return test
+    return None
+
+# Colliders whose `_collides_with_<type>` methods are already covered by the tables
+_BUILTIN_COLLIDERS = (Collider, Polygon, Circle, RotatedCollider)
+
+def _overrides(cls, name):
+    """True if a class other than the built-in colliders defines the method `name` for `cls`."""
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            return base not in _BUILTIN_COLLIDERS
+    return False
+
+def _resolve(type_a, type_b):
+    """Find the test for a pair of types that isn't in the table yet and remember it.
+    `_collides_with_<type>` methods defined by subclasses come first, then the base classes' tests,
+    then the `_collides_with_<type>` methods of other colliders."""
+    method_name = f"_collides_with_{type_b.__name__.lower()}"
+    other_method_name = f"_collides_with_{type_a.__name__.lower()}"
+    call_a = lambda a, b: getattr(a, method_name)(b)
+    # fallback: try the other object
+    call_b = lambda a, b: getattr(b, other_method_name)(a)
+
+    if _overrides(type_a, method_name):
+        test = call_a
+    elif _overrides(type_b, other_method_name):
+        test = call_b
+    else:
+        test = _lookup_bases(_DISPATCH, type_a, type_b)
+        if test is None:
+            if hasattr(type_a, method_name):
+                test = call_a
+            elif hasattr(type_b, other_method_name):
+                test = call_b
+            else:
+                raise NotImplementedError(f"Collision not implemented between {type_a} and {type_b}")
+
+    _DISPATCH[(type_a, type_b)] = test
+    return test
+
+def _resolve_contact(type_a, type_b):
+    """Same as `_resolve` for contacts; only subclasses of the built in colliders have them."""
+    test = _lookup_bases(_CONTACTS, type_a, type_b)
+    if test is None:
+        raise NotImplementedError(f"Contact not implemented between {type_a} and {type_b}")
+    _CONTACTS[(type_a, type_b)] = test
+    return test
@@ -0,0 +1,85 @@
+import struct
+
+# Input kinds stored in a recording
+KEY_DOWN = 0
+KEY_UP = 1
+MOUSE_DOWN = 2
+MOUSE_UP = 3
+MOUSE_MOVE = 4
+
+_MAGIC = b"VXIR"
+_VERSION = 1
+_HEADER = struct.Struct("<4sB")
+# frame, kind, then 3 values: (key, 0, 0) for keys, (x, y, button/buttons) for the mouse
+_RECORD = struct.Struct("<IBiii")
+
+
+class InputRecorder:
+    """Records every input the engine receives, together with the frame it was handled on
+    (counted from the frame the recording started on).
+
+    A recording is a compact binary log (17 bytes per event), see `save()` and `InputReplay`.
+
+    Example:
+        recorder = engine.record_input()
+        ...
+        engine.stop_recording().save("session.vxir")
+    """
+
+    def __init__(self):
+        self._data = bytearray(_HEADER.pack(_MAGIC, _VERSION))
+        self.count = 0
+
+    def record(self, frame, kind, a=0, b=0, c=0):
+        self._data += _RECORD.pack(frame, kind, a, b, c)
+        self.count += 1
+
+    def to_bytes(self):
+        return bytes(self._data)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self._data)
+
+
+class InputReplay:
+    """Feeds a recording made by `InputRecorder` back into an engine on the same frames,
+    counted from the frame the replay started on.
+
+    Live input is ignored while a replay is playing. Use it with `fixed_timestep=True` or a
+    `HeadlessEngine` so frames line up exactly with the recorded session.
+
+    Example:
+        engine.play_input(InputReplay.load("session.vxir"))
+    """
+
+    def __init__(self, data):
+        magic, version = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC:
+            raise ValueError("Not a VertexEngine input recording")
+        if version != _VERSION:
+            raise ValueError(f"Unsupported input recording version: {version}")
+
+        self.records = list(_RECORD.iter_unpack(memoryview(data)[_HEADER.size:]))
+        self._index = 0
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    @property
+    def finished(self):
+        return self._index >= len(self.records)
+
+    def inject(self, engine, frame):
+        """Apply every recorded input up to and including `frame` (counted from the start of the replay) to `engine`."""
+        records = self.records
+        i = self._index
+        while i < len(records) and records[i][0] <= frame:
+            engine._apply_input(*records[i][1:])
+            i += 1
+        self._index = i
+
+    def rewind(self):
+        self._index = 0
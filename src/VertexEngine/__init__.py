@@ -19,10 +19,12 @@ Supported OSes
 It is written on top of the excellent Pygame library which is ran on the even more excellent SDL library which runs on every Desktop OS with SDL."""
 import pygame
 from ._base import *
-from .engine import GameEngine
-from .scenes import Scene, SceneManager
-from .assets import AssetManager
+from .engine import GameEngine, HeadlessEngine
+from .scenes import Scene, LightScene, SceneManager
+from .assets import AssetManager, SpriteBatch
 from .audio import AudioManager
+from .pools import ObjectPool, SurfacePool
+from .camera import Camera
 import os
 
 
@@ -4,35 +4,91 @@ from PyQt6.QtGui import QFont, QCursor, QFontMetrics
 from PyQt6.QtCore import Qt
 from VertexEngine.Vertex import VBox
 
+# Dirty-rect tracking: while a GameEngine in dirty-rect mode is drawing a scene,
+# `_dirty_target` is the engine screen and every Draw call on it appends its bounding rect
+_dirty_target = None
+_dirty_rects = None
+
+def _mark_dirty(surface, rect, static=False):
+    """Report `rect` as changed if `surface` is the screen being tracked. Returns `rect`.
+    `static` drawing (the same every frame) isn't reported, and neither is a rect the last reported one already covers."""
+    if not static and surface is _dirty_target and _dirty_rects is not None:
+        # Optimized: Things drawn on top of what was just reported add nothing to the repaint
+        if not _dirty_rects or not _dirty_rects[-1].contains(rect):
+            _dirty_rects.append(rect)
+    return rect
+
 class VertexScreen():
     """Draw on VertexEngine's Screen."""
     def __init__(self):
         pass
     class Draw():
-        "The Draw class to draw on VertexEngine"
+        """The Draw class to draw on VertexEngine.
+        Every function returns the `pygame.Rect` it changed.
+
+        With `camera=` (a `Camera`) every function takes world coordinates instead of screen ones,
+        and anything outside the camera's view isn't drawn at all (an empty rect is returned).
+
+        In dirty-rect mode every call reports what it drew as changed. Pass `static=True` for things
+        drawn the same way every frame (backgrounds, HUD frames) so they don't make the whole screen
+        dirty; call `engine.invalidate()` when static content does change."""
         def __init__(self):
             pass
-        def rect(self, surface, color, rect=None):
+        def rect(self, surface, color, rect=None, camera=None, static=False):
             """Draw a Rectangle of a solid color."""
-            pygame.draw.rect(surface, color, rect)
-        def polygon(self, surface, color, points, width):
+            if camera is not None:
+                rect = camera.rect_to_screen(rect)
+                if rect is None:
+                    return pygame.Rect(0, 0, 0, 0)
+            return _mark_dirty(surface, pygame.draw.rect(surface, color, rect), static)
+        def polygon(self, surface, color, points, width, camera=None, static=False):
             "Draw a polygon by marking points on the screen to make an n-gon"
-            pygame.draw.polygon(surface, color, points, width)
-        def circle(self, circle_surface, color, center, radius, width, draw_top_right, draw_top_left, draw_bottom_right, draw_bottom_left):
+            if camera is not None:
+                points = camera.points_to_screen(points, width)
+                if points is None:
+                    return pygame.Rect(0, 0, 0, 0)
+                width = camera.scale(width)
+            return _mark_dirty(surface, pygame.draw.polygon(surface, color, points, width), static)
+        def circle(self, circle_surface, color, center, radius, width, draw_top_right, draw_top_left, draw_bottom_right, draw_bottom_left, camera=None, static=False):
             """Draw a Circle with radius, color, etc."""
-            pygame.draw.circle(circle_surface, color, center, radius, width, draw_top_right, draw_top_left, draw_bottom_left, draw_bottom_right)
-        def ellipse(self, surface, color, rect, width):
+            if camera is not None:
+                if not camera.is_visible((center[0] - radius, center[1] - radius, radius * 2, radius * 2)):
+                    return pygame.Rect(0, 0, 0, 0)
+                center = camera.to_screen(*center)
+                radius, width = camera.scale(radius), camera.scale(width)
+            return _mark_dirty(circle_surface, pygame.draw.circle(circle_surface, color, center, radius, width, draw_top_right, draw_top_left, draw_bottom_left, draw_bottom_right), static)
+        def ellipse(self, surface, color, rect, width, camera=None, static=False):
             """Draw an elipse with surface, color, rect and width""" 
-            pygame.draw.ellipse(surface, color, rect, width)
-        def arc(self, surface, color, rect, start_angle, stop_angle, width):
+            if camera is not None:
+                rect = camera.rect_to_screen(rect)
+                if rect is None:
+                    return pygame.Rect(0, 0, 0, 0)
+                width = camera.scale(width)
+            return _mark_dirty(surface, pygame.draw.ellipse(surface, color, rect, width), static)
+        def arc(self, surface, color, rect, start_angle, stop_angle, width, camera=None, static=False):
             "Draw an arc with a lot of values"
-            pygame.draw.arc(surface, color, rect, start_angle, stop_angle, width)
-        def line(self, surface, color, start_pos, end_pos, width):
+            if camera is not None:
+                rect = camera.rect_to_screen(rect)
+                if rect is None:
+                    return pygame.Rect(0, 0, 0, 0)
+                width = camera.scale(width)
+            return _mark_dirty(surface, pygame.draw.arc(surface, color, rect, start_angle, stop_angle, width), static)
+        def line(self, surface, color, start_pos, end_pos, width, camera=None, static=False):
             """Draw a line"""
-            pygame.draw.line(surface, color, start_pos, end_pos, width)
-        def lines(self, surface, color, closed, points, width):
+            if camera is not None:
+                points = camera.points_to_screen((start_pos, end_pos), width)
+                if points is None:
+                    return pygame.Rect(0, 0, 0, 0)
+                (start_pos, end_pos), width = points, camera.scale(width)
+            return _mark_dirty(surface, pygame.draw.line(surface, color, start_pos, end_pos, width), static)
+        def lines(self, surface, color, closed, points, width, camera=None, static=False):
             '''Draw a pair of lines'''
-            pygame.draw.lines(surface, color, closed, points, width)
+            if camera is not None:
+                points = camera.points_to_screen(points, width)
+                if points is None:
+                    return pygame.Rect(0, 0, 0, 0)
+                width = camera.scale(width)
+            return _mark_dirty(surface, pygame.draw.lines(surface, color, closed, points, width), static)
         def aaline(
             self,
             surface,
@@ -40,25 +96,54 @@ class VertexScreen():
             start_pos,
             end_pos,
             blend,
+            camera=None,
+            static=False,
         ):
             '''Draw an aaline'''
-            pygame.draw.aaline(surface, color, start_pos, end_pos, blend)
+            if camera is not None:
+                points = camera.points_to_screen((start_pos, end_pos), 1)
+                if points is None:
+                    return pygame.Rect(0, 0, 0, 0)
+                start_pos, end_pos = points
+            return _mark_dirty(surface, pygame.draw.aaline(surface, color, start_pos, end_pos, blend), static)
         def aalines(
             self,
             surface,
             color,
             closed,
             points,
-            blend
+            blend,
+            camera=None,
+            static=False,
         ):
             '''Draw a set of aalines'''
-            pygame.draw.aalines(surface, color, closed, points, blend)
+            if camera is not None:
+                points = camera.points_to_screen(points, 1)
+                if points is None:
+                    return pygame.Rect(0, 0, 0, 0)
+            return _mark_dirty(surface, pygame.draw.aalines(surface, color, closed, points, blend), static)
     class Font():
-        """VertexEngine's offical Font Engine"""
-        def __init__(self, path=None, size=24, antialias=True):
+        """VertexEngine's offical Font Engine
+
+        Rendered text is cached (up to `cache_size` different text/color pairs), so drawing the same
+        HUD text every frame doesn't render and allocate a new surface each time."""
+        def __init__(self, path=None, size=24, antialias=True, cache_size=64):
             self.font = pygame.font.Font(path, size)
             self.size = size
             self.antialias = antialias
+            self.cache_size = cache_size
+            self._cache = {}
+
+        def render(self, text, color):
+            """Return the (cached) surface of `text` in `color`."""
+            key = (text, tuple(color))
+            surf = self._cache.get(key)
+            if surf is None:
+                if len(self._cache) >= self.cache_size:
+                    # Dicts keep insertion order, drop the oldest entry
+                    del self._cache[next(iter(self._cache))]
+                surf = self._cache[key] = self.font.render(text, self.antialias, color)
+            return surf
         
         def draw(
                 self,
@@ -73,9 +158,11 @@ class VertexScreen():
                 shadow_offset=(2, 2),
                 outline=False,
                 outline_color=(0, 0, 0),
-                outline_thickness=1
-            ):      
-                text_surf = self.font.render(text, self.antialias, color)
+                outline_thickness=1,
+                static=False
+            ):
+                """Draw `text` at `pos`. `static=True` doesn't report it in dirty-rect mode, see `Draw`."""
+                text_surf = self.render(text, color)
                 rect = text_surf.get_rect()
 
                 if center:
@@ -85,21 +172,28 @@ class VertexScreen():
 
                 # 🔲 Outline
                 if outline:
+                    # Optimized: Render the outline once and blit it at every offset
+                    outline_surf = self.render(text, outline_color)
                     for dx in range(-outline_thickness, outline_thickness + 1):
                         for dy in range(-outline_thickness, outline_thickness + 1):
                             if dx == 0 and dy == 0:
                                 continue
-                            outline_surf = self.font.render(text, self.antialias, outline_color)
                             surface.blit(outline_surf, rect.move(dx, dy))
 
                 # 🌑 Shadow
                 if shadow:
-                    shadow_surf = self.font.render(text, self.antialias, shadow_color)
+                    shadow_surf = self.render(text, shadow_color)
                     shadow_rect = rect.move(shadow_offset)
                     surface.blit(shadow_surf, shadow_rect)
 
                 surface.blit(text_surf, rect)
 
+                if surface is _dirty_target:
+                    # Shadows and outlines spill outside the text rect
+                    _mark_dirty(surface, rect.move(shadow_offset).union(rect) if shadow else rect, static)
+                    if outline:
+                        _mark_dirty(surface, rect.inflate(outline_thickness * 2, outline_thickness * 2), static)
+
 class Rect(pygame.rect.Rect):
     '''Define a rect to pass into VertexScreen.Draw.rect()'''
     def __init__(self, left, top, width, height):
@@ -1,6 +1,8 @@
 import pygame
 from PyQt6.QtGui import QImage
 import typing_extensions as typing
+from . import _base
+from ._base import _mark_dirty, VertexScreen
 
 @typing.deprecated('This is not a public API, use AssetManager pls :D')
 class QtRenderer:
@@ -46,6 +48,7 @@ class AssetManager:
     """The `AssetManager` is a class to draw and load images and assets of any kind."""
     def __init__(self):
         self.images = {}
+        self.fonts = {}
         self._scaled_cache = {}  # cache for scaled versions
 
     def load_image(self, name: str, path: str):
@@ -67,7 +70,16 @@ class AssetManager:
     def get_image(self, name: str):
         return self.images.get(name)
 
-    def draw(self, target_surface, name, pos=(0, 0), size=None):
+    def load_font(self, name: str, path: str = None, size: int = 24):
+        """Load a `VertexScreen.Font` from `path` (None for the default font) and keep it as `name`."""
+        if name not in self.fonts:
+            self.fonts[name] = VertexScreen.Font(path, size)
+        return self.fonts[name]
+
+    def get_font(self, name: str):
+        return self.fonts.get(name)
+
+    def draw(self, target_surface, name, pos=(0, 0), size=None, camera=None, static=False):
         """
         Draw image.
         size = (width, height) to rescale.
@@ -75,17 +87,40 @@ class AssetManager:
         target_surface is the surface to draw the actual image
         pos is where to draw it in coordinates
         name is the identity of the image. make sure it's loaded in by `load_image`
+        camera is an optional `Camera`, pos is then in world coordinates and off-screen images are skipped
+        static=True doesn't report the image in dirty-rect mode (for backgrounds drawn the same every frame)
         """
+        if camera is not None:
+            img = self.images.get(name)
+            if img is None:
+                print(f"[Warning] Image '{name}' not loaded!")
+                return
+            w, h = size or img.get_size()
+            rect = camera.rect_to_screen((pos[0], pos[1], w, h))
+            if rect is None:
+                return pygame.Rect(0, 0, 0, 0)
+            pos = rect.topleft
+            if camera.zoom != 1:
+                # Zoomed images go through the scaled cache like any other size
+                size = (max(1, round(w * camera.zoom)), max(1, round(h * camera.zoom)))
+
+        img = self._surface(name, size)
+        if img is None:
+            return
+
+        return _mark_dirty(target_surface, target_surface.blit(img, pos), static)
+
+    def _surface(self, name, size=None):
+        """Return the image `name`, scaled to `size` if given, or None (with a warning) if it isn't loaded."""
         img = self.images.get(name)
 
         if not img:
             print(f"[Warning] Image '{name}' not loaded!")
-            return
+            return None
 
-        # If no scaling requested → draw normally
+        # If no scaling requested → use the original
         if size is None:
-            target_surface.blit(img, pos)
-            return
+            return img
 
         # Use cache key
         cache_key = (name, size)
@@ -97,4 +132,122 @@ class AssetManager:
         else:
             scaled_img = self._scaled_cache[cache_key]
 
-        target_surface.blit(scaled_img, pos)
+        return scaled_img
+
+    def batch(self):
+        """Return a new `SpriteBatch` that can draw this manager's images by name."""
+        return SpriteBatch(self)
+
+class SpriteBatch:
+    """
+    Collects sprites for a frame and draws them all with a single `Surface.blits()` call
+    (`Surface.fblits()` on pygame-ce when possible), instead of one Python call per sprite.
+
+    Sprites are grouped by image, so every sprite of the same image is drawn together. Within one
+    image they keep the order they were added in; sprites of images added later are drawn on top.
+
+    ``` python
+    batch = assets.batch()
+
+    # in draw()
+    for coin in coins:
+        batch.add("coin", (coin.x, coin.y))
+    batch.add_many("bullet", bullets.pos)   # e.g. an EntityStore's positions
+    batch.flush(surface)
+    ```
+
+    `image` can be the name of an image in the `AssetManager` (optionally with `size`, which uses its
+    scaled cache) or a `pygame.Surface`.
+    """
+    def __init__(self, assets=None):
+        self.assets = assets
+        # image surface -> [positions, areas], in the order the images were first added. `areas` is
+        # None until a sprite of that image has one, then it has an area (or None) for every position
+        self._groups = {}
+        self._has_area = False
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def _group(self, image, size):
+        if isinstance(image, str):
+            if self.assets is None:
+                raise ValueError("Drawing images by name needs an AssetManager")
+            image = self.assets._surface(image, size)
+            if image is None:
+                return None
+        elif size is not None:
+            raise ValueError("size only works with AssetManager image names")
+
+        group = self._groups.get(image)
+        if group is None:
+            group = self._groups[image] = [[], None]
+        return group
+
+    def add(self, image, pos, area=None, size=None):
+        """Queue one sprite at `pos`. `area` draws only that part of the image (for sprite sheets)."""
+        group = self._group(image, size)
+        if group is None:
+            return
+
+        positions, areas = group
+        if area is not None and areas is None:
+            areas = group[1] = [None] * len(positions)
+            self._has_area = True
+        positions.append(pos)
+        if areas is not None:
+            areas.append(area)
+        self.count += 1
+
+    def add_many(self, image, positions, size=None):
+        """Queue `image` at every position in `positions` (a list of pairs or an `(n, 2)` array)."""
+        group = self._group(image, size)
+        if group is None:
+            return
+
+        if hasattr(positions, "tolist"):
+            positions = positions.tolist()
+        group[0].extend(positions)
+        if group[1] is not None:
+            group[1].extend([None] * len(positions))
+        self.count += len(positions)
+
+    def flush(self, target_surface, special_flags=0, clear=True):
+        """Draw every queued sprite on `target_surface`, then forget them unless `clear` is False
+        (to draw the same static batch every frame). Returns the number of sprites drawn."""
+        count = self.count
+        if not count:
+            return 0
+
+        tracking = target_surface is _base._dirty_target and _base._dirty_rects is not None
+        fblits = getattr(target_surface, "fblits", None)
+
+        # Optimized: One C call for the whole batch instead of one blit call per sprite
+        if self._has_area or (special_flags and (fblits is None or tracking)):
+            sequence = []
+            for image, (positions, areas) in self._groups.items():
+                if areas is None:
+                    sequence.extend([(image, pos, None, special_flags) for pos in positions])
+                else:
+                    sequence.extend([(image, pos, area, special_flags) for pos, area in zip(positions, areas)])
+        else:
+            sequence = [(image, pos) for image, (positions, _) in self._groups.items() for pos in positions]
+
+        if fblits is not None and not tracking and not self._has_area:
+            # pygame-ce: fblits doesn't build the list of rects we don't need
+            fblits(sequence, special_flags)
+        else:
+            rects = target_surface.blits(sequence, doreturn=tracking)
+            if tracking:
+                _base._dirty_rects.extend(rects)
+
+        if clear:
+            self.clear()
+        return count
+
+    def clear(self):
+        """Forget every queued sprite."""
+        self._groups.clear()
+        self._has_area = False
+        self.count = 0
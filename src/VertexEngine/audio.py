@@ -5,6 +5,8 @@ class AudioManager:
     def __init__(self):
         pygame.mixer.init()
         self.sounds = {}
+        # name -> path every sound was loaded from
+        self._paths = {}
         self.music = None
 
     def load_sound(self, name, path):
@@ -16,8 +18,17 @@ class AudioManager:
         
         :param name: An identity that points to the file path
         :param path: The actual path to get the audio from.
+
+        If `name` is already loaded from the same `path` (for example by `GameEngine.preload()`), the
+        loaded sound is returned without decoding the file again. With a different `path` the sound
+        under `name` is replaced.
         """
-        self.sounds[name] = pygame.mixer.Sound(path)
+        if name in self.sounds and self._paths.get(name) == path:
+            return self.sounds[name]
+
+        sound = self.sounds[name] = pygame.mixer.Sound(path)
+        self._paths[name] = path
+        return sound
 
     def play_sound(self, name, loops=0):
         if name in self.sounds:
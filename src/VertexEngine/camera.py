@@ -0,0 +1,136 @@
+"""This is the camera of VertexEngine. It turns world coordinates into screen coordinates and skips off-screen draws."""
+import math
+import pygame
+
+class Camera:
+    """
+    A view into a scrolling world. `x`, `y` is the world point shown at the center of the view,
+    `zoom` scales the world (2.0 shows everything twice as big) and `bounds` is an optional world
+    rect the view never leaves.
+
+    Pass it to drawing functions as `camera=` and they take world coordinates: `VertexScreen.Draw`,
+    `AssetManager.draw()` and `Tilemap.draw()` move and scale what they draw, and skip it entirely
+    when it is outside the view.
+
+    ``` python
+    self.camera = Camera(engine.screen.get_size(), bounds=(0, -2000, 4000, 2400), smoothing=0.85)
+
+    # in update()
+    self.camera.follow(self.player.x, self.player.y)
+    self.camera.update()
+
+    # in draw()
+    VertexScreen.Draw.rect(VertexScreen.Draw, surface, (255, 0, 0), player_rect, camera=self.camera)
+    ```
+
+    `smoothing` (0 to 1) is the part of the distance to the followed point that is left after each
+    `update()`; 0 snaps straight to it.
+    """
+    def __init__(self, view_size, pos=(0, 0), zoom=1.0, bounds=None, smoothing=0.0):
+        self.view_width, self.view_height = view_size
+        self.x, self.y = pos
+        self.zoom = zoom
+        self.bounds = pygame.Rect(bounds) if bounds is not None else None
+        self.smoothing = smoothing
+        self._target = None
+
+        # The world rect in view, refreshed by `_refresh()`
+        self.left = self.top = 0.0
+        self.right = self.bottom = 0.0
+        self._refresh()
+
+    @property
+    def view_rect(self):
+        """The part of the world that is visible, as a `pygame.Rect`."""
+        left, top = math.floor(self.left), math.floor(self.top)
+        return pygame.Rect(left, top, math.ceil(self.right) - left, math.ceil(self.bottom) - top)
+
+    def resize(self, width, height):
+        """Change the size of the view, e.g. from `Scene.on_resize()`."""
+        self.view_width, self.view_height = width, height
+        self._refresh()
+
+    def move_to(self, x, y):
+        """Center the view on `x`, `y` right away."""
+        self.x, self.y = x, y
+        self._target = None
+        self._refresh()
+
+    def set_zoom(self, zoom):
+        self.zoom = zoom
+        self._refresh()
+
+    def follow(self, x, y):
+        """Move towards `x`, `y` on the next `update()` calls."""
+        self._target = (x, y)
+
+    def update(self):
+        """Move towards the followed point. Call it once per scene update."""
+        if self._target is not None:
+            tx, ty = self._target
+            keep = self.smoothing
+            self.x = tx + (self.x - tx) * keep
+            self.y = ty + (self.y - ty) * keep
+        self._refresh()
+
+    def _refresh(self):
+        half_w = self.view_width / self.zoom / 2
+        half_h = self.view_height / self.zoom / 2
+
+        bounds = self.bounds
+        if bounds is not None:
+            # A view bigger than the bounds stays centered on them
+            if half_w * 2 >= bounds.width:
+                self.x = bounds.centerx
+            else:
+                self.x = min(max(self.x, bounds.left + half_w), bounds.right - half_w)
+            if half_h * 2 >= bounds.height:
+                self.y = bounds.centery
+            else:
+                self.y = min(max(self.y, bounds.top + half_h), bounds.bottom - half_h)
+
+        self.left, self.right = self.x - half_w, self.x + half_w
+        self.top, self.bottom = self.y - half_h, self.y + half_h
+
+    # ---------------------- TRANSFORMS ----------------------
+
+    def to_screen(self, x, y):
+        """Turn a world point into a screen point."""
+        zoom = self.zoom
+        return round((x - self.left) * zoom), round((y - self.top) * zoom)
+
+    def to_world(self, x, y):
+        """Turn a screen point (e.g. the mouse position) into a world point."""
+        return x / self.zoom + self.left, y / self.zoom + self.top
+
+    def is_visible(self, rect):
+        """Return True if the world rect `(x, y, w, h)` is at least partly in view."""
+        x, y, w, h = rect
+        return x < self.right and x + w > self.left and y < self.bottom and y + h > self.top
+
+    def rect_to_screen(self, rect):
+        """Turn a world rect into a screen `pygame.Rect`, or None if it is out of view."""
+        x, y, w, h = rect
+        # Optimized: Culled before any transform work is done
+        if not (x < self.right and x + w > self.left and y < self.bottom and y + h > self.top):
+            return None
+        zoom = self.zoom
+        sx, sy = round((x - self.left) * zoom), round((y - self.top) * zoom)
+        return pygame.Rect(sx, sy, round((x + w - self.left) * zoom) - sx, round((y + h - self.top) * zoom) - sy)
+
+    def points_to_screen(self, points, margin=0):
+        """Turn a list of world points into screen points, or None if their bounding box
+        (grown by `margin`) is out of view."""
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        if not (min(xs) - margin < self.right and max(xs) + margin > self.left
+                and min(ys) - margin < self.bottom and max(ys) + margin > self.top):
+            return None
+        left, top, zoom = self.left, self.top, self.zoom
+        return [(round((x - left) * zoom), round((y - top) * zoom)) for x, y in zip(xs, ys)]
+
+    def scale(self, length):
+        """Turn a world length (radius, line width) into screen pixels, never shrinking a visible one to 0."""
+        if length <= 0:
+            return length
+        return max(1, round(length * self.zoom))
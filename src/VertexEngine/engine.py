@@ -1,15 +1,79 @@
-from PyQt6.QtWidgets import QWidget
-from PyQt6.QtGui import QImage, QPainter
-from PyQt6.QtCore import QTimer, Qt
+from PyQt6.QtWidgets import QWidget, QApplication
+from PyQt6.QtGui import QImage, QPainter, QRegion
+from PyQt6.QtCore import QTimer, Qt, QRect, QRectF, QEvent
+from PyQt6 import sip
+import os
+import time
 import pygame
+from . import _base
+from ._base import VertexScreen
 from .scenes import SceneManager
+from .profiler import FrameProfiler
+from .pools import pool_stats
+from .simulation import SimulationThread
+from .preloader import Preloader
 from VertexEngine.InputSystem.KeyInputs import Input
+from VertexEngine.InputSystem.Replay import (
+    InputRecorder, KEY_DOWN, KEY_UP, MOUSE_DOWN, MOUSE_UP, MOUSE_MOVE
+)
 
 pygame.init()
 
+# Valid values of `when_hidden` and `when_unfocused`
+IDLE_POLICIES = ("none", "throttle", "pause")
+
 class GameEngine(QWidget):
-    """`GameEngine()` is a class to create the window for your VertexEngine game."""
-    def __init__(self, width=800, height=600, color=(50, 50, 100), fps=60, position=(0, 0)):
+    """`GameEngine()` is a class to create the window for your VertexEngine game.
+
+    `fps` is how often the window is redrawn. By default the scene is updated once per redraw,
+    so a slow frame also slows the game down.
+
+    Pass `fixed_timestep=True` to run the simulation at a constant `sim_hz` instead. Every frame
+    the measured time since the last frame is added to an accumulator and `Scene.update()` runs
+    once for every whole simulation step it contains (at most `max_steps` times, so a long stall
+    can't snowball). The leftover fraction of a step is stored in `alpha` (0.0 to 1.0), and passed
+    to `Scene.draw(surface, alpha)` when the scene's `draw` takes it, so the scene can interpolate
+    between its previous and current state.
+
+    Pass `dirty_rects=True` for mostly-static scenes. The screen is then only fully cleared on the
+    first frame (or after `invalidate()`); afterwards only the areas changed last frame are cleared
+    to `color` (or restored from `dirty_background` if set), and only the areas changed this frame
+    and last frame are repainted. `VertexScreen.Draw`, `VertexScreen.Font` and `AssetManager.draw`
+    report what they draw automatically; anything drawn another way should be reported with
+    `mark_dirty(rect)`.
+
+    Pass `virtual_size=(width, height)` to always draw at that resolution no matter how big the
+    window is. `screen` then keeps that size, and the frame is scaled to the window only when it is
+    painted (`scale_filter="smooth"` or `"nearest"` for pixel art). With `letterbox=True` the aspect
+    ratio is kept and the borders are filled with black. Mouse positions are converted to
+    `screen` coordinates for the scenes.
+
+    Pass `threaded=True` to run `Scene.update()` on a background thread at `sim_hz` (see
+    `SimulationThread` for which scene hooks run on which thread). The window then only draws the
+    latest `Scene.snapshot()` with `Scene.draw_snapshot()`, and skips frames with no new snapshot.
+
+    `frame` counts finished scene updates. `record_input()` logs every input with the frame it was
+    handled on (counted from the start of the recording), and `play_input()` feeds such a log back
+    in on the same frames counted from the start of the replay, so a session can be replayed exactly (with `fixed_timestep=True` or a `HeadlessEngine`).
+
+    Mouse motion is coalesced: scenes get at most one `MOUSEMOTION` per frame, with `rel` covering
+    all the movement since the last one. Scenes with `raw_mouse_motion = True` get every sample.
+
+    `when_hidden` and `when_unfocused` choose what happens while the window is minimized/hidden or
+    not the active window: `"none"` keeps running normally, `"throttle"` drops to `idle_fps` (and
+    stops drawing while hidden), and `"pause"` stops the frame timer entirely (and the simulation
+    thread of `threaded=True`). Full speed comes back as soon as the window is shown or activated again.
+
+    `preload()` loads a scene's `asset_manifest` on background threads while the current scene keeps
+    running, so switching to it later doesn't stall.
+
+    Call `enable_profiler()` to record how long every part of a frame takes and read it back
+    with `frame_stats()`, optionally with an on-screen overlay.
+    """
+    def __init__(self, width=800, height=600, color=(50, 50, 100), fps=60, position=(0, 0),
+                 fixed_timestep=False, sim_hz=60, max_steps=5, dirty_rects=False,
+                 virtual_size=None, scale_filter="smooth", letterbox=True, threaded=False,
+                 when_hidden="none", when_unfocused="none", idle_fps=5):
         super().__init__()
         self.width = width
         self.height = height
@@ -17,17 +81,83 @@ class GameEngine(QWidget):
         self.fps = fps
         self.position = position 
 
+        # Timing: `dt` is the measured time of the last frame in seconds
+        self.fixed_timestep = fixed_timestep
+        self.sim_hz = sim_hz
+        self.max_steps = max_steps
+        self.dt = 0.0
+        self.alpha = 1.0
+        self._accumulator = 0.0
+        self._last_time = time.perf_counter()
+        self.frame = 0
+
+        # Input recording and replay, see `record_input()` and `play_input()`. Recorded frames
+        # are counted from the frame the recording started on, and replayed from the frame
+        # the replay started on
+        self.recorder = None
+        self.replay = None
+        self._record_start = 0
+        self._replay_start = 0
+
+        # Mouse motion coalescing: the last position sent to the scenes, and the motion
+        # (x, y, buttons) waiting to be sent at the start of the next frame
+        self._mouse_pos = (0, 0)
+        self._pending_motion = None
+
+        # Dirty-rect rendering
+        self.dirty_rects = dirty_rects
+        self.dirty_background = None
+        self._dirty = []
+        self._prev_dirty = []
+        self._full_redraw = True
+
+        # Frame profiling, see `enable_profiler()`
+        self.profiler = None
+        self.show_profiler = False
+        self._profiler_font = None
+
+        # Virtual resolution: `_viewport` is where `screen` is painted in the window
+        self.virtual_size = virtual_size
+        self.scale_filter = scale_filter
+        self.letterbox = letterbox
+        self._update_viewport()
+
+        # Idle throttling, see `_apply_idle_policy()`
+        for policy in (when_hidden, when_unfocused):
+            if policy not in IDLE_POLICIES:
+                raise ValueError(f"Unknown idle policy '{policy}', use one of: {', '.join(IDLE_POLICIES)}")
+        self.when_hidden = when_hidden
+        self.when_unfocused = when_unfocused
+        self.idle_fps = idle_fps
+        self.idle = False
+        self._skip_render = False
+
         self.keys_down = set()
         
-        # Optimized: Use standard RGB to avoid unneeded alpha calculations
-        self.screen = pygame.Surface((self.width, self.height))
+        # `screen` is a view into `_backbuffer`, which is only reallocated when the window
+        # grows past its capacity. Resizes are applied at most once per frame.
+        self._backbuffer = None
+        self._pending_size = None
+        self.screen = self._alloc_screen(virtual_size or (self.width, self.height))
         
         # Optimized: Pre-allocate a persistent QImage that shares memory with Pygame
         self._sync_qimage()
 
         self.scene_manager = SceneManager()
 
+        # Background simulation, see `SimulationThread`
+        self.simulation = None
+        self._drawn_frame = -1
+
+        # Background asset loading, see `preload()`
+        self.preloader = None
+        if threaded:
+            self.simulation = SimulationThread(self.scene_manager, sim_hz, max_steps)
+            self.simulation.start()
+
         self.timer = QTimer(self)
+        # Optimized: PreciseTimer keeps millisecond accuracy instead of the default 5% slack
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.timer.timeout.connect(self._update_frame)
         self.timer.start(1000 // self.fps)
 
@@ -39,77 +169,589 @@ class GameEngine(QWidget):
         """Helper to map Pygame pixel buffer directly to QImage memory."""
         # Optimized: QImage points directly to the Pygame surface memory buffer
         # This completely removes pygame.image.tobytes() CPU copying overhead
+        # The raw pixel address is used instead of get_buffer(), which would keep the
+        # surface locked and make every blit onto the screen fail
         self.img = QImage(
-            self.screen.get_buffer(),
-            self.width,
-            self.height,
+            sip.voidptr(self.screen._pixels_address),
+            self.screen.get_width(),
+            self.screen.get_height(),
             self.screen.get_pitch(),
             QImage.Format.Format_RGB32
         )
+        # The QImage doesn't own its pixels, keep the memory it points at alive with it
+        self._img_source = self._backbuffer
+
+    def _alloc_screen(self, size):
+        """Return a `size` view into the backbuffer, growing the backbuffer only if it's too small."""
+        width, height = size
+        backbuffer = self._backbuffer
+
+        if backbuffer is None or width > backbuffer.get_width() or height > backbuffer.get_height():
+            # Optimized: Round the capacity up so dragging the window bigger doesn't reallocate every step
+            cap_w = -(-max(width, backbuffer.get_width() if backbuffer else 0) // 64) * 64
+            cap_h = -(-max(height, backbuffer.get_height() if backbuffer else 0) // 64) * 64
+            # Optimized: Use standard RGB to avoid unneeded alpha calculations
+            backbuffer = self._backbuffer = pygame.Surface((cap_w, cap_h))
+
+        return backbuffer.subsurface((0, 0, width, height))
 
     # ---------------------- RENDER ----------------------
 
     def paintEvent(self, event):
+        start = time.perf_counter()
         # Optimized: Use a context manager to instantly close/flush the painter
+        # Optimized: Only blit the requested area, Qt clips it further to the exact update region
+        rect = event.rect()
         with QPainter(self) as painter:
-            painter.drawImage(0, 0, self.img)
+            if self.virtual_size is None:
+                painter.drawImage(rect, self.img, rect)
+            else:
+                self._paint_scaled(painter)
+
+        if self.profiler is not None:
+            self.profiler.add("present", time.perf_counter() - start)
+
+    def _paint_scaled(self, painter):
+        """Scale the virtual-resolution screen into the viewport."""
+        viewport = self._viewport
+        if self.letterbox:
+            painter.fillRect(QRect(0, 0, self.width, viewport.top()), Qt.GlobalColor.black)
+            painter.fillRect(QRect(0, viewport.bottom() + 1, self.width, self.height), Qt.GlobalColor.black)
+            painter.fillRect(QRect(0, 0, viewport.left(), self.height), Qt.GlobalColor.black)
+            painter.fillRect(QRect(viewport.right() + 1, 0, self.width, self.height), Qt.GlobalColor.black)
+
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, self.scale_filter == "smooth")
+        painter.drawImage(QRectF(viewport), self.img)
+
+    def _update_viewport(self):
+        """Work out where the virtual screen goes in a window of `width` x `height`."""
+        if self.virtual_size is None or not self.letterbox:
+            self._viewport = QRect(0, 0, self.width, self.height)
+            return
+
+        vw, vh = self.virtual_size
+        scale = min(self.width / vw, self.height / vh)
+        w, h = round(vw * scale), round(vh * scale)
+        self._viewport = QRect((self.width - w) // 2, (self.height - h) // 2, w, h)
+
+    def to_screen(self, x, y):
+        """Convert a window position to a position on `screen`."""
+        if self.virtual_size is None:
+            return int(x), int(y)
+
+        viewport = self._viewport
+        vw, vh = self.virtual_size
+        return (
+            int((x - viewport.x()) * vw / max(viewport.width(), 1)),
+            int((y - viewport.y()) * vh / max(viewport.height(), 1))
+        )
+
+    def _to_window_rect(self, rect):
+        """Convert a rect on `screen` to the QRect it covers in the window."""
+        if self.virtual_size is None:
+            return QRect(rect.x, rect.y, rect.w, rect.h)
+
+        viewport = self._viewport
+        vw, vh = self.virtual_size
+        sx = viewport.width() / vw
+        sy = viewport.height() / vh
+        # Grow by a pixel on each side so filtering at the edges is repainted too
+        return QRect(
+            int(viewport.x() + rect.x * sx) - 1,
+            int(viewport.y() + rect.y * sy) - 1,
+            int(rect.w * sx) + 3,
+            int(rect.h * sy) + 3
+        )
+
+    def mark_dirty(self, rect):
+        """Report an area of the screen that changed this frame (only used with `dirty_rects=True`)."""
+        self._dirty.append(pygame.Rect(rect))
+
+    def invalidate(self):
+        """Clear and repaint the whole screen on the next frame."""
+        self._full_redraw = True
 
     def resizeEvent(self, event):
         size = event.size()
         self.width = size.width()
         self.height = size.height()
+        self._update_viewport()
+        self._full_redraw = True
+
+        if self.virtual_size is not None:
+            # Optimized: The virtual screen never changes size, only the viewport does
+            return
         
-        # Re-allocate surfaces and re-link memory map on resize
-        self.screen = pygame.Surface((self.width, self.height))
+        # Optimized: Window drags fire many resizes per frame, the screen is only resized
+        # once at the start of the next frame
+        self._pending_size = (self.width, self.height)
+
+    def _apply_resize(self):
+        """Resize `screen` to the last size requested by `resizeEvent` and tell the scenes."""
+        width, height = self._pending_size
+        self._pending_size = None
+        if (width, height) == self.screen.get_size():
+            return
+
+        # Re-link memory map on resize
+        self.screen = self._alloc_screen((width, height))
         self._sync_qimage()
+        self._full_redraw = True
+        self.scene_manager.resize(width, height)
+
+    def closeEvent(self, event):
+        self.stop_simulation()
+        if self.preloader is not None:
+            self.preloader.shutdown()
+        super().closeEvent(event)
+
+    # ---------------------- ASSETS ----------------------
+
+    def preload(self, manifest, assets=None, audio=None, on_ready=None, on_progress=None):
+        """Load a scene's `asset_manifest` (or a manifest dict) in the background into `assets`
+        (an `AssetManager`) and `audio` (an `AudioManager`). Returns a `PreloadJob`.
+
+        `on_progress(progress)` and `on_ready()` are called at the start of a frame on the GUI thread.
+
+        ``` python
+        engine.preload(LevelScene, assets, on_ready=lambda: engine.scene_manager.set_scene(LevelScene(engine, assets)))
+        ```
+        """
+        if self.preloader is None:
+            self.preloader = Preloader()
+        return self.preloader.load(manifest, assets, audio, on_ready, on_progress)
+
+    # ---------------------- IDLE ----------------------
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._apply_idle_policy()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._apply_idle_policy()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() in (QEvent.Type.WindowStateChange, QEvent.Type.ActivationChange):
+            self._apply_idle_policy()
+
+    def _apply_idle_policy(self):
+        """Pick the frame rate for the current window state, see `when_hidden` and `when_unfocused`."""
+        hidden = not self.isVisible() or self.window().isMinimized()
+
+        if hidden:
+            policy = self.when_hidden
+        elif not self.isActiveWindow():
+            policy = self.when_unfocused
+        else:
+            policy = "none"
+
+        was_running = self.timer.isActive()
+        was_idle = self.idle
+        self.idle = policy != "none"
+        self._skip_render = hidden and self.idle
+
+        if self.simulation is not None:
+            if policy == "pause":
+                self.simulation.pause()
+            else:
+                self.simulation.resume()
+
+        if policy == "pause":
+            self.timer.stop()
+            return
+
+        interval = 1000 // (self.idle_fps if policy == "throttle" else self.fps)
+        if not was_running or self.timer.interval() != interval:
+            self.timer.start(interval)
+
+        if not was_running:
+            # Don't count the paused time as one giant frame
+            self._last_time = time.perf_counter()
+
+        if was_idle and not self.idle:
+            # Resume instantly instead of waiting for the next tick
+            self.invalidate()
+            self._update_frame()
 
     # ---------------------- UPDATE ----------------------
 
+    def stop_simulation(self):
+        """Stop the background simulation thread of `threaded=True`, if it is running."""
+        if self.simulation is not None:
+            self.simulation.stop()
+
+    @property
+    def sim_dt(self):
+        """The length of one simulation step in seconds when `fixed_timestep` is on."""
+        return 1.0 / self.sim_hz
+
     def _update_frame(self):
+        now = time.perf_counter()
+        dt = now - self._last_time
+        self._last_time = now
+        self._tick(dt)
+
+    def _tick(self, dt, draw=True):
+        """Advance the game by one frame that took `dt` seconds."""
+        self.dt = dt
+        profiler = self.profiler
+
+        if self._pending_size is not None:
+            self._apply_resize()
+
+        # Counted as "events" by `_dispatch`, not as part of the update
+        if self._pending_motion is not None:
+            self._flush_motion()
+
+        if self.preloader is not None:
+            self.preloader.poll()
+
+        # Scene switches asked for on the simulation thread
+        if self.scene_manager._pending:
+            self.scene_manager.apply_pending()
+
         if not self.hasFocus():
             self.keys_down.clear()
 
-        # Optimized: Clear and draw into the pygame surface during the update step
-        self.screen.fill(self.color)
+        start = time.perf_counter()
+        simulation = self.simulation
+        if simulation is not None:
+            # Scenes update on the simulation thread, only redraw when there is something new
+            if simulation.frame == self._drawn_frame and not self._full_redraw:
+                draw = False
+            self._drawn_frame = simulation.frame
+        elif self.fixed_timestep:
+            self._step_fixed(dt)
+        else:
+            self._simulate()
+
+        if profiler is not None:
+            profiler.add("update", time.perf_counter() - start)
+
+        if draw and not self._skip_render:
+            self._render()
+            # Schedule the visual swap, the painting itself is timed in `paintEvent`
+            self._present()
+
+        if profiler is not None:
+            profiler.end_frame()
+
+    def _render(self):
+        """Clear the screen and draw the current scene into it."""
+        profiler = self.profiler
+        start = time.perf_counter()
+
+        if not self.dirty_rects:
+            # Optimized: Clear and draw into the pygame surface during the update step
+            self.screen.fill(self.color)
+            if profiler is not None:
+                profiler.add("clear", time.perf_counter() - start)
+            self._draw_scene()
+            return
+
+        if self._full_redraw:
+            self.screen.fill(self.color)
+            if self.dirty_background is not None:
+                self.screen.blit(self.dirty_background, (0, 0))
+        else:
+            # Optimized: Only erase what was drawn last frame
+            for rect in self._prev_dirty:
+                if self.dirty_background is not None:
+                    self.screen.blit(self.dirty_background, rect, rect)
+                else:
+                    self.screen.fill(self.color, rect)
+
+        if profiler is not None:
+            profiler.add("clear", time.perf_counter() - start)
+
+        _base._dirty_target = self.screen
+        _base._dirty_rects = self._dirty
+        try:
+            self._draw_scene()
+        finally:
+            _base._dirty_target = None
+            _base._dirty_rects = None
+
+    def _draw_scene(self):
+        start = time.perf_counter()
+
+        if self.simulation is not None:
+            self.scene_manager.draw_snapshot(self.screen, self.simulation.latest)
+        elif self.fixed_timestep:
+            self.scene_manager.draw(self.screen, self.alpha)
+        else:
+            self.scene_manager.draw(self.screen)
+
+        if self.profiler is not None:
+            self.profiler.add("draw", time.perf_counter() - start)
+            if self.show_profiler:
+                self._draw_profiler()
+
+    # ---------------------- PROFILING ----------------------
+
+    def enable_profiler(self, size=300, overlay=False):
+        """Start recording per-phase timings of the last `size` frames.
+        With `overlay=True` the p50/p95/p99 frame times are drawn in the top-left corner."""
+        self.profiler = FrameProfiler(size)
+        self.show_profiler = overlay
+
+    def disable_profiler(self):
+        self.profiler = None
+        self.show_profiler = False
+
+    def frame_stats(self):
+        """Return `{phase: {"p50", "p95", "p99", "max"}}` in milliseconds, see `FrameProfiler.summary()`."""
+        if self.profiler is None:
+            return {}
+        return self.profiler.summary()
+
+    def pool_stats(self):
+        """Return `{name: {"hits", "misses", "hit_rate", "free"}}` for every named `ObjectPool`,
+        including the engine's shared `surfaces` pool."""
+        return pool_stats()
+
+    def _draw_profiler(self):
+        if self._profiler_font is None:
+            self._profiler_font = VertexScreen.Font(None, 18)
+
+        stats = self.profiler.summary()
+        y = 4
+        for phase in FrameProfiler.PHASES + ("frame",):
+            s = stats[phase]
+            self._profiler_font.draw(
+                self.screen,
+                f"{phase:<8}{s['p50']:6.2f}{s['p95']:6.2f}{s['p99']:6.2f} ms",
+                (4, y),
+                shadow=True,
+                shadow_offset=(1, 1)
+            )
+            y += 16
+
+        for name, s in pool_stats().items():
+            self._profiler_font.draw(
+                self.screen,
+                f"{name:<8}{s['hit_rate'] * 100:6.1f}% hits",
+                (4, y),
+                shadow=True,
+                shadow_offset=(1, 1)
+            )
+            y += 16
+
+    def _present(self):
+        """Ask Qt to repaint the parts of the window that changed."""
+        if not self.dirty_rects or self._full_redraw:
+            self._full_redraw = False
+            self._prev_dirty = self._dirty
+            self._dirty = []
+            self.update()
+            return
+
+        region = QRegion()
+        for rect in self._prev_dirty + self._dirty:
+            region = region.united(self._to_window_rect(rect))
+
+        self._prev_dirty = self._dirty
+        self._dirty = []
+
+        if not region.isEmpty():
+            self.update(region)
+
+    def _simulate(self):
+        """Run one scene update, feeding in replayed input for this frame first."""
+        if self.replay is not None:
+            self.replay.inject(self, self.frame - self._replay_start)
+            if self.replay.finished:
+                self.replay = None
+
         self.scene_manager._update()
-        self.scene_manager.draw(self.screen)
-        
-        # Schedule the visual swap
-        self.update()  
+        self.frame += 1
+
+    def _step_fixed(self, dt):
+        """Run as many fixed simulation steps as `dt` covers and update `alpha`."""
+        step = self.sim_dt
+        # Never bank more time than we are allowed to catch up on
+        self._accumulator = min(self._accumulator + dt, step * self.max_steps)
+
+        while self._accumulator >= step:
+            self._simulate()
+            self._accumulator -= step
+
+        self.alpha = self._accumulator / step
 
     # ---------------------- INPUT ----------------------
 
     def keyPressEvent(self, event):
-        Input._key_down(event.key())
+        self._input(KEY_DOWN, event.key())
 
     def keyReleaseEvent(self, event):
-        Input._key_up(event.key())
+        self._input(KEY_UP, event.key())
 
     def mousePressEvent(self, event):
+        # Keep motion and clicks in order
+        if self._pending_motion is not None:
+            self._flush_motion()
         # Optimized: Extracted local positions to avoid multiple property lookups
         pos = event.position()
-        pygame_event = pygame.event.Event(
-            pygame.MOUSEBUTTONDOWN,
-            {"pos": (int(pos.x()), int(pos.y())), "button": event.button()}
-        )
-        self.scene_manager.handle_event(pygame_event)
+        x, y = self.to_screen(pos.x(), pos.y())
+        self._input(MOUSE_DOWN, x, y, event.button().value)
 
     def mouseReleaseEvent(self, event):
+        if self._pending_motion is not None:
+            self._flush_motion()
         pos = event.position()
-        pygame_event = pygame.event.Event(
-            pygame.MOUSEBUTTONUP,
-            {"pos": (int(pos.x()), int(pos.y())), "button": event.button()}
-        )
-        self.scene_manager.handle_event(pygame_event)
+        x, y = self.to_screen(pos.x(), pos.y())
+        self._input(MOUSE_UP, x, y, event.button().value)
 
     def mouseMoveEvent(self, event):
         pos = event.position()
-        pygame_event = pygame.event.Event(
-            pygame.MOUSEMOTION,
-            {
-                "pos": (int(pos.x()), int(pos.y())),
-                "rel": (0, 0),
-                "buttons": pygame.mouse.get_pressed()
-            }
+        x, y = self.to_screen(pos.x(), pos.y())
+        # Optimized: Button state comes from the Qt event instead of asking pygame every sample
+        qt_buttons = event.buttons()
+        buttons = (
+            bool(qt_buttons & Qt.MouseButton.LeftButton)
+            | bool(qt_buttons & Qt.MouseButton.MiddleButton) << 1
+            | bool(qt_buttons & Qt.MouseButton.RightButton) << 2
         )
-        self.scene_manager.handle_event(pygame_event)
+
+        if getattr(self.scene_manager.current_scene, "raw_mouse_motion", False):
+            self._input(MOUSE_MOVE, x, y, buttons)
+        else:
+            # Optimized: Only keep the latest sample, it is sent once at the start of the next frame
+            self._pending_motion = (x, y, buttons)
+
+    def _flush_motion(self):
+        x, y, buttons = self._pending_motion
+        self._pending_motion = None
+        self._input(MOUSE_MOVE, x, y, buttons)
+
+    def _input(self, kind, a=0, b=0, c=0):
+        """Handle one live input: record it and apply it, unless a replay is playing."""
+        if self.replay is not None:
+            return
+
+        if self.recorder is not None:
+            self.recorder.record(self._input_frame() - self._record_start, kind, a, b, c)
+
+        self._apply_input(kind, a, b, c)
+
+    def _apply_input(self, kind, a=0, b=0, c=0):
+        """Apply one input, live or from an `InputReplay`."""
+        if kind == KEY_DOWN or kind == KEY_UP:
+            if kind == KEY_DOWN:
+                Input._key_down(a)
+            else:
+                Input._key_up(a)
+            # Scenes without Qt focus (LightScene) get keys through handle_event
+            if getattr(self.scene_manager.current_scene, "key_events", False):
+                self._dispatch(pygame.event.Event(pygame.KEYDOWN if kind == KEY_DOWN else pygame.KEYUP, {"key": a}))
+        elif kind == MOUSE_MOVE:
+            last_x, last_y = self._mouse_pos
+            self._mouse_pos = (a, b)
+            self._dispatch(pygame.event.Event(
+                pygame.MOUSEMOTION,
+                {"pos": (a, b), "rel": (a - last_x, b - last_y), "buttons": (bool(c & 1), bool(c & 2), bool(c & 4))}
+            ))
+        else:
+            self._mouse_pos = (a, b)
+            self._dispatch(pygame.event.Event(
+                pygame.MOUSEBUTTONDOWN if kind == MOUSE_DOWN else pygame.MOUSEBUTTONUP,
+                {"pos": (a, b), "button": Qt.MouseButton(c)}
+            ))
+
+    def _input_frame(self):
+        """The frame live input is handled on."""
+        return self.simulation.frame if self.simulation is not None else self.frame
+
+    def record_input(self, recorder=None):
+        """Start recording input into `recorder` (a new `InputRecorder` by default) and return it.
+        Frames are recorded relative to the current frame."""
+        self._record_start = self._input_frame()
+        self.recorder = recorder if recorder is not None else InputRecorder()
+        return self.recorder
+
+    def stop_recording(self):
+        """Stop recording input and return the `InputRecorder`."""
+        recorder = self.recorder
+        self.recorder = None
+        return recorder
+
+    def play_input(self, replay):
+        """Replay an `InputReplay` from the current frame on. Live input is ignored until it ends."""
+        if self.simulation is not None:
+            raise ValueError("Input replay needs the engine to step scenes itself, not threaded=True")
+        replay.rewind()
+        self._replay_start = self.frame
+        self.replay = replay
+
+    def _dispatch(self, event):
+        """Send a pygame event to the scenes."""
+        if self.simulation is not None:
+            # Scenes handle events on the simulation thread, right before their next update
+            self.simulation.post_event(event)
+            return
+
+        if self.profiler is None:
+            self.scene_manager.handle_event(event)
+            return
+
+        start = time.perf_counter()
+        self.scene_manager.handle_event(event)
+        self.profiler.add("events", time.perf_counter() - start)
+
+
+class HeadlessEngine(GameEngine):
+    """A `GameEngine` that never opens a window, for servers, tests and benchmarks.
+
+    It builds the same `scene_manager`, `screen` surface and input handling as `GameEngine`,
+    but has no timer. Call `step(n)` to advance `n` frames as fast as possible. Every frame
+    is treated as exactly `1 / fps` seconds long (or one simulation step with `fixed_timestep=True`),
+    so runs are deterministic.
+
+    If no `QApplication` exists yet, one is created on Qt's `offscreen` platform.
+    Pass `draw=False` to skip drawing entirely and only measure updates.
+
+    Example usage:
+
+    ``` python
+    engine = HeadlessEngine(draw=False)
+    engine.scene_manager.set_scene(MyScene(engine))
+    engine.step(10000)
+    ```
+    """
+    def __init__(self, *args, draw=True, **kwargs):
+        if kwargs.get("threaded"):
+            raise ValueError("HeadlessEngine steps scenes itself and can't use threaded=True")
+
+        app = QApplication.instance()
+        if app is None:
+            os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+            app = QApplication([])
+
+        super().__init__(*args, **kwargs)
+        # Keep the application alive as long as the engine
+        self._app = app
+        self.timer.stop()
+        self.draw = draw
+        self.frames = 0
+
+    def step(self, n=1, draw=None):
+        """Advance `n` frames. `draw` overrides the engine's `draw` setting for these frames."""
+        if draw is None:
+            draw = self.draw
+        dt = self.sim_dt if self.fixed_timestep else 1.0 / self.fps
+
+        for _ in range(n):
+            self._tick(dt, draw)
+        self.frames += n
+
+    def _apply_idle_policy(self):
+        # Never shown and stepped by hand, there is nothing to throttle
+        pass
+
+    def _present(self):
+        # Nothing to show, just keep the dirty-rect bookkeeping moving
+        self._full_redraw = False
+        self._prev_dirty = self._dirty
+        self._dirty = []
@@ -0,0 +1,272 @@
+"""This is the entity store of VertexEngine. It keeps lots of entities in NumPy arrays (needs `numpy`)."""
+import numpy as np
+
+# A handle is `generation << 32 | slot`. Removing an entity frees its slot for reuse and bumps the
+# slot's generation, so old handles of a reused slot no longer match.
+_SLOT_BITS = 32
+_SLOT_MASK = (1 << _SLOT_BITS) - 1
+_GENERATION_MASK = (1 << 31) - 1
+
+class EntityStore:
+    """
+    Stores entities as a struct of arrays: every component is one contiguous NumPy array, and
+    entity `i` is row `i` of all of them. Updating thousands of entities is then a handful of
+    array operations instead of a Python loop over objects.
+
+    Built-in components (all views of the live entities, so they can be changed in place):
+    - `pos`: float `(n, 2)` positions
+    - `vel`: float `(n, 2)` velocities
+    - `size`: float `(n, 2)` widths and heights
+    - `flags`: uint32 `(n,)` bit flags for your own use (teams, states, ...)
+
+    More components can be added with `components`, e.g. `EntityStore(components={"hp": np.int32})`,
+    and read with `store["hp"]`.
+
+    `spawn()` returns a handle that keeps pointing at the same entity while others are removed.
+    Handles of removed entities are recycled with a new generation, so `alive()` is False for a
+    stale handle even after its slot is reused, and the bookkeeping only grows with the largest
+    number of entities alive at once. Rows are not stable: `remove()` moves the last entity into
+    the hole (swap-remove), so use `index(handle)` to find an entity's row instead of keeping row
+    numbers around.
+
+    ``` python
+    blocks = EntityStore()
+    blocks.spawn(x, -40, vy=6, w=40, h=40)
+
+    # in update()
+    blocks.integrate()
+    blocks.remove_where(blocks.pos[:, 1] > VIRTUAL_HEIGHT)
+    if blocks.overlaps(player.x, player.y, player.w, player.h).any():
+        ...
+    ```
+    """
+    def __init__(self, capacity=256, components=None, dtype=np.float64):
+        self.count = 0
+        self._capacity = max(1, capacity)
+        self._dtype = dtype
+
+        # Column name -> (dtype, row shape) of every component
+        self._layout = {"pos": (dtype, (2,)), "vel": (dtype, (2,)), "size": (dtype, (2,)), "flags": (np.uint32, ())}
+        for name, component_dtype in (components or {}).items():
+            if name in self._layout:
+                raise ValueError(f"'{name}' is already a component")
+            self._layout[name] = (component_dtype, ())
+
+        self._columns = {name: np.zeros((self._capacity,) + shape, dt) for name, (dt, shape) in self._layout.items()}
+
+        # Row -> handle of its entity, slot -> row (-1 while free) and slot -> current generation
+        self._handles = np.zeros(self._capacity, np.int64)
+        self._rows = np.full(self._capacity, -1, np.int64)
+        self._generations = np.zeros(self._capacity, np.int64)
+        # Slots used so far, and the free ones among them (reused last freed first)
+        self._slot_count = 0
+        self._free = []
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, component):
+        """Return the live rows of `component`."""
+        return self._columns[component][:self.count]
+
+    @property
+    def pos(self):
+        return self._columns["pos"][:self.count]
+
+    @property
+    def vel(self):
+        return self._columns["vel"][:self.count]
+
+    @property
+    def size(self):
+        return self._columns["size"][:self.count]
+
+    @property
+    def flags(self):
+        return self._columns["flags"][:self.count]
+
+    @property
+    def handles(self):
+        """The handle of every live entity, in row order."""
+        return self._handles[:self.count]
+
+    def _reserve(self, rows, slots):
+        """Grow the arrays so `rows` entities and `slots` slots fit."""
+        if rows > self._capacity:
+            capacity = self._capacity
+            while capacity < rows:
+                capacity *= 2
+            for name, column in self._columns.items():
+                grown = np.zeros((capacity,) + column.shape[1:], column.dtype)
+                grown[:self.count] = column[:self.count]
+                self._columns[name] = grown
+            grown = np.zeros(capacity, np.int64)
+            grown[:self.count] = self._handles[:self.count]
+            self._handles = grown
+            self._capacity = capacity
+
+        if slots > len(self._rows):
+            size = len(self._rows)
+            while size < slots:
+                size *= 2
+            grown = np.full(size, -1, np.int64)
+            grown[:len(self._rows)] = self._rows
+            self._rows = grown
+            grown = np.zeros(size, np.int64)
+            grown[:len(self._generations)] = self._generations
+            self._generations = grown
+
+    def _release(self, slots):
+        """Free `slots` (an int array) for reuse, invalidating their handles."""
+        self._rows[slots] = -1
+        self._generations[slots] = (self._generations[slots] + 1) & _GENERATION_MASK
+        self._free.extend(slots.tolist())
+
+    def spawn(self, x=0.0, y=0.0, vx=0.0, vy=0.0, w=0.0, h=0.0, flags=0, **components):
+        """Add one entity and return its handle. Extra components are given as keyword arguments."""
+        extra = self._layout.keys() - {"pos", "vel", "size", "flags"}
+        unknown = components.keys() - extra
+        if unknown:
+            raise TypeError(f"Unknown components: {', '.join(unknown)}")
+
+        # The row is written before a slot is taken, so a bad value can't lose the slot
+        i = self.count
+        self._reserve(i + 1, self._slot_count + 1)
+        columns = self._columns
+        columns["pos"][i] = (x, y)
+        columns["vel"][i] = (vx, vy)
+        columns["size"][i] = (w, h)
+        columns["flags"][i] = flags
+        for name in extra:
+            columns[name][i] = components.get(name, 0)
+
+        if self._free:
+            slot = self._free.pop()
+        else:
+            slot = self._slot_count
+            self._slot_count += 1
+
+        handle = int(self._generations[slot]) << _SLOT_BITS | slot
+        self._handles[i] = handle
+        self._rows[slot] = i
+        self.count += 1
+        return handle
+
+    def spawn_many(self, n, pos=None, vel=None, size=None, flags=None, **components):
+        """Add `n` entities at once and return their handles as an array.
+        Every component can be a single value or anything that broadcasts to `n` rows."""
+        given = {"pos": pos, "vel": vel, "size": size, "flags": flags, **components}
+        for name in given:
+            if name not in self._columns:
+                raise TypeError(f"Unknown component: {name}")
+
+        # The rows are written before slots are taken, so a bad value can't lose any
+        start, end = self.count, self.count + n
+        self._reserve(end, self._slot_count + n)
+        for name, column in self._columns.items():
+            value = given.get(name)
+            column[start:end] = 0 if value is None else value
+
+        # Free slots first, then new ones
+        free = self._free
+        reused = min(n, len(free))
+        slots = np.empty(n, np.int64)
+        if reused:
+            slots[:reused] = free[len(free) - reused:]
+            del free[len(free) - reused:]
+        first = self._slot_count
+        slots[reused:] = np.arange(first, first + n - reused)
+        self._slot_count += n - reused
+        handles = self._generations[slots] << _SLOT_BITS | slots
+        self._handles[start:end] = handles
+        self._rows[slots] = np.arange(start, end)
+        self.count = end
+        return handles
+
+    def _row(self, handle):
+        """Row of `handle`, or -1 if its entity was removed."""
+        slot = handle & _SLOT_MASK
+        if handle < 0 or slot >= self._slot_count or self._generations[slot] != handle >> _SLOT_BITS:
+            return -1
+        return int(self._rows[slot])
+
+    def alive(self, handle):
+        return self._row(handle) >= 0
+
+    def index(self, handle):
+        """Return the row of the entity `handle` in the component arrays."""
+        row = self._row(handle)
+        if row < 0:
+            raise KeyError(f"Entity {handle} doesn't exist")
+        return row
+
+    def remove(self, handle):
+        """Remove one entity. The last entity is moved into its row."""
+        i = self.index(handle)
+        last = self.count - 1
+        if i != last:
+            for column in self._columns.values():
+                column[i] = column[last]
+            moved = self._handles[last]
+            self._handles[i] = moved
+            self._rows[moved & _SLOT_MASK] = i
+        self._release(np.array([handle & _SLOT_MASK]))
+        self.count = last
+
+    def remove_where(self, mask):
+        """Remove every entity where the boolean `mask` (one value per live row) is True.
+        The remaining entities keep their order."""
+        mask = np.asarray(mask, bool)
+        if not mask.any():
+            return 0
+
+        # Optimized: One compaction pass per column instead of a swap per removed entity
+        keep = ~mask
+        n = self.count
+        kept = int(keep.sum())
+        for column in self._columns.values():
+            column[:kept] = column[:n][keep]
+
+        handles = self._handles[:n]
+        self._release(handles[mask] & _SLOT_MASK)
+        handles = handles[keep]
+        self._handles[:kept] = handles
+        self._rows[handles & _SLOT_MASK] = np.arange(kept)
+        self.count = kept
+        return n - kept
+
+    def clear(self):
+        self._release(self._handles[:self.count] & _SLOT_MASK)
+        self.count = 0
+
+    def integrate(self, dt=1.0):
+        """Move every entity by its velocity, `dt` is the length of the step (1.0 means one frame)."""
+        n = self.count
+        pos = self._columns["pos"][:n]
+        if dt == 1.0:
+            pos += self._columns["vel"][:n]
+        else:
+            pos += self._columns["vel"][:n] * dt
+
+    def with_flags(self, flags):
+        """Return a mask of the entities that have all bits of `flags` set."""
+        return (self.flags & flags) == flags
+
+    def in_rect(self, x, y, w, h):
+        """Return a mask of the entities whose position lies inside the rect."""
+        pos = self.pos
+        px, py = pos[:, 0], pos[:, 1]
+        return (px >= x) & (px < x + w) & (py >= y) & (py < y + h)
+
+    def overlaps(self, x, y, w, h):
+        """Return a mask of the entities whose box (`pos`, `size`) overlaps the rect."""
+        pos, size = self.pos, self.size
+        px, py = pos[:, 0], pos[:, 1]
+        return (px < x + w) & (px + size[:, 0] > x) & (py < y + h) & (py + size[:, 1] > y)
+
+    def rects(self, mask=None):
+        """Return the boxes of the entities (or the ones in `mask`) as an int `(n, 4)` array, ready for drawing."""
+        boxes = np.concatenate((self.pos, self.size), axis=1)
+        if mask is not None:
+            boxes = boxes[mask]
+        return boxes.astype(np.int32)
@@ -3,6 +3,7 @@ import random
 from PyQt6.QtWidgets import QApplication
 from VertexEngine.engine import GameEngine
 from VertexEngine.scenes import Scene
+from VertexEngine.entities import EntityStore
 from VertexEngine import VertexScreen
 from VertexEngine.InputSystem.KeyInputs import Input
 from PyQt6.QtCore import Qt
@@ -13,67 +14,6 @@ VIRTUAL_WIDTH = 800
 VIRTUAL_HEIGHT = 450
 
 
-#class ScreenScaler:
-#    def __init__(self, engine):
-#        self.engine = engine
-#    @property
-#    def scale(self):
-#        return min(
-#            self.engine.width / VIRTUAL_WIDTH,
-#            self.engine.height / VIRTUAL_HEIGHT,
-#        )
-#    @property
-#    def offset_x(self):
-#        return int((self.engine.width - VIRTUAL_WIDTH * self.scale) / 2)
-#    @property
-#    def offset_y(self):
-#        return int((self.engine.height - VIRTUAL_HEIGHT * self.scale) / 2)
-#    def rect(self, x, y, w, h):
-#        s = self.scale
-#        return (
-#            int(x * s) + self.offset_x,
-#            int(y * s) + self.offset_y,
-#            int(w * s),
-#            int(h * s),
-#        )
-#    def pos(self, x, y):
-#        s = self.scale
-#        return (
-#            int(x * s) + self.offset_x,
-#            int(y * s) + self.offset_y,
-#        )
-class ScreenScaler:
-    def __init__(self, engine):
-        self.engine = engine
-
-    @property
-    def scale(self):
-        return min(
-            self.engine.width / VIRTUAL_WIDTH,
-            self.engine.height / VIRTUAL_HEIGHT,
-        )
-    
-    # 👇 NO CENTERING
-    @property
-    def offset_x(self):
-        return 0
-    
-    @property
-    def offset_y(self):
-        return 0
-    
-    def rect(self, x, y, w, h):
-        s = self.scale
-        return (
-            int(x * s),
-            int(y * s),
-            int(w * s),
-            int(h * s),
-        )
-    
-    def pos(self, x, y):
-        s = self.scale
-        return int(x * s), int(y * s)
 # =====================
 # GAME OBJECTS
 # =====================
@@ -113,15 +53,7 @@ class Player:
             self.on_ground = True
         print(self.x)
 
-class Block:
-    def __init__(self):
-        self.size = 40
-        self.x = random.randint(0, VIRTUAL_WIDTH - self.size)
-        self.y = -self.size
-        self.speed = random.randint(4, 8)
-
-    def update(self):
-        self.y += self.speed
+BLOCK_SIZE = 40
 
 
 # =====================
@@ -130,42 +62,39 @@ class Block:
 class MainScene(Scene):
     def __init__(self, engine):
         super().__init__(engine)
-        self.scaler = ScreenScaler(engine)
 
         self.player = Player()
-        self.blocks = []
+        # All falling blocks live in one store and are moved together
+        self.blocks = EntityStore()
         self.dead = False
+        self.deathfont = VertexScreen.Font(None, 24)
 
     def update(self):
         if not self.dead:
             self.player.update()
 
             if random.random() < 0.03:
-                self.blocks.append(Block())
+                self.blocks.spawn(
+                    random.randint(0, VIRTUAL_WIDTH - BLOCK_SIZE), -BLOCK_SIZE,
+                    vy=random.randint(4, 8), w=BLOCK_SIZE, h=BLOCK_SIZE,
+                )
 
-            for b in self.blocks:
-                b.update()
-                if (
-                    self.player.x < b.x + b.size and
-                    self.player.x + self.player.w > b.x and
-                    self.player.y < b.y + b.size and
-                    self.player.y + self.player.h > b.y
-                ):
-                    self.dead = True
+            self.blocks.integrate()
+            if self.blocks.overlaps(self.player.x, self.player.y, self.player.w, self.player.h).any():
+                self.dead = True
 
-            self.blocks = [b for b in self.blocks if b.y < VIRTUAL_HEIGHT]
+            self.blocks.remove_where(self.blocks.pos[:, 1] >= VIRTUAL_HEIGHT)
 
         Input.input_update()
 
     def draw(self, surface):
-        s = self.scaler
-
+        # The engine scales the virtual screen to the window, so draw in virtual coordinates
         # background
         VertexScreen.Draw.rect(
             VertexScreen.Draw,
             surface,
             (15, 15, 15),
-            s.rect(0, 0, VIRTUAL_WIDTH, VIRTUAL_HEIGHT),
+            (0, 0, VIRTUAL_WIDTH, VIRTUAL_HEIGHT),
         )
 
         # player
@@ -173,25 +102,24 @@ class MainScene(Scene):
             VertexScreen.Draw,
             surface,
             (0, 255, 255),
-            s.rect(self.player.x, self.player.y, self.player.w, self.player.h),
+            (self.player.x, self.player.y, self.player.w, self.player.h),
         )
 
         # blocks
-        for b in self.blocks:
+        for rect in self.blocks.rects().tolist():
             VertexScreen.Draw.rect(
                 VertexScreen.Draw,
                 surface,
                 (255, 0, 0),
-                s.rect(b.x, b.y, b.size, b.size),
+                rect,
             )
 
         # death text
         if self.dead:
-            deathfont = VertexScreen.Font(None, 24)
-            deathfont.draw(
+            self.deathfont.draw(
                 surface,
                 "DOGPILED",
-                s.pos(VIRTUAL_WIDTH // 2, VIRTUAL_HEIGHT // 2)
+                (VIRTUAL_WIDTH // 2, VIRTUAL_HEIGHT // 2)
             )
 
 # =====================
@@ -200,7 +128,7 @@ class MainScene(Scene):
 if __name__ == "__main__":
     app = QApplication(sys.argv)
 
-    engine = GameEngine()
+    engine = GameEngine(virtual_size=(VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
     engine.setWindowTitle("Dogpile Dodger (VertexEngine)")
     engine.setMinimumSize(VIRTUAL_WIDTH, VIRTUAL_HEIGHT)
     engine.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
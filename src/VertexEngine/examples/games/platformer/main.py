@@ -15,6 +15,7 @@ update and drawing
 from VertexEngine.engine import GameEngine
 from VertexEngine.scenes import Scene
 from VertexEngine import VertexScreen
+from VertexEngine.camera import Camera
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
 import sys
@@ -39,7 +40,8 @@ coin_img = pygame.transform.scale(
 class Main(Scene):
     def __init__(self, engine):
         super().__init__(engine)
-        self.world_offset_y = engine.height // 2
+        # World y = 0 starts in the middle of the screen, then the camera follows the player up and down
+        self.camera = Camera((engine.width, engine.height), pos=(engine.width // 2, 0), smoothing=0.9)
         self.score = 0
         self.coins = [
             {"x": 200, "y": -35 * SCALE, "collected": False},
@@ -134,10 +136,13 @@ class Main(Scene):
             self.vy = 0
             self.on_ground = True
 
+        self.camera.follow(self.engine.width // 2, min(self.y + self.h / 2, 0))
+        self.camera.update()
+
 
     # --- DRAW ---
     def draw(self, surface):
-        oy = self.world_offset_y  # visual offset
+        camera = self.camera
 
         # Background
         VertexScreen.Draw.rect(
@@ -147,20 +152,22 @@ class Main(Scene):
             (0, 0, self.engine.width, self.engine.height)
         )
 
-        # Ground (shifted DOWN)
+        # Ground (in world coordinates, the camera moves it on screen)
         VertexScreen.Draw.rect(
             VertexScreen.Draw,
             surface,
             (50, 200, 50),
-            (-2000 * SCALE, GROUND_Y + oy, 4000 * SCALE, 200 * SCALE)
+            (-2000 * SCALE, GROUND_Y, 4000 * SCALE, 200 * SCALE),
+            camera=camera
         )
 
-        # Player (shifted DOWN)
+        # Player
         VertexScreen.Draw.rect(
             VertexScreen.Draw,
             surface,
             (255, 100, 100),
-            (self.x, self.y + oy, self.w, self.h)
+            (self.x, self.y, self.w, self.h),
+            camera=camera
         )
 
         # Coins
@@ -168,10 +175,9 @@ class Main(Scene):
             if coin["collected"]:
                 continue
             
-            surface.blit(
-                coin_img,
-                (coin["x"], coin["y"] + oy)
-            )
+            rect = camera.rect_to_screen((coin["x"], coin["y"], coin_img.get_width(), coin_img.get_height()))
+            if rect:
+                surface.blit(coin_img, rect)
 
         # Platforms
         for px, py, pw, ph in self.platforms:
@@ -179,7 +185,8 @@ class Main(Scene):
                 VertexScreen.Draw,
                 surface,
                 (100, 180, 255),
-                (px, py + oy, pw, ph)
+                (px, py, pw, ph),
+                camera=camera
             )
 
 if __name__ == "__main__":
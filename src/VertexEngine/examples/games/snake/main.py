@@ -7,6 +7,7 @@ from PyQt6.QtCore import Qt
 
 from VertexEngine.engine import GameEngine
 from VertexEngine.scenes import Scene
+from VertexEngine.tilemap import Tilemap
 
 # =============================
 # CONFIG
@@ -17,6 +18,7 @@ TILE = 30
 FPS = 60
 GRID_W = WIDTH // TILE
 GRID_H = HEIGHT // TILE
+SNAKE = 1
 
 # =============================
 # SNAKE SCENE
@@ -26,6 +28,9 @@ class SnakeScene(Scene):
         super().__init__(engine)
 
         self.snake = [(10, 10)]
+        # The snake's body lives in a tilemap, so only the cells that change get redrawn
+        self.grid = Tilemap(GRID_W, GRID_H, TILE, {SNAKE: (0, 255, 0)}, chunk_size=8)
+        self.grid.set(10, 10, SNAKE)
         self.direction = (1, 0)
         self.next_direction = self.direction
 
@@ -73,21 +78,17 @@ class SnakeScene(Scene):
             return
 
         self.snake.insert(0, new_head)
+        self.grid.set(*new_head, SNAKE)
 
         if new_head == self.food:
             self.food = self.spawn_food()
         else:
-            self.snake.pop()
+            self.grid.set(*self.snake.pop(), 0)
 
     def draw(self, screen):
         screen.fill((0, 0, 0))
 
-        for x, y in self.snake:
-            pygame.draw.rect(
-                screen,
-                (0, 255, 0),
-                (x * TILE, y * TILE, TILE, TILE)
-            )
+        self.grid.draw(screen)
 
         fx, fy = self.food
         pygame.draw.rect(
@@ -0,0 +1,211 @@
+"""This is the particle system of VertexEngine. It moves and draws thousands of particles with NumPy (needs `numpy`)."""
+import numpy as np
+import pygame
+from ._base import _mark_dirty
+
+# Sprite sizes kept by a ParticleSystem before the oldest one is dropped
+_MAX_SPRITE_SIZES = 8
+
+class Emitter:
+    """A point that spawns `rate` particles per frame into a `ParticleSystem`. Move it by changing `x`, `y`."""
+    __slots__ = ("x", "y", "rate", "active", "_carry")
+
+    def __init__(self, x, y, rate):
+        self.x = x
+        self.y = y
+        self.rate = rate
+        self.active = True
+        self._carry = 0.0
+
+class ParticleSystem:
+    """
+    Particles of one look (color, size, lifetime, ...) stored in NumPy arrays: positions, velocities,
+    ages and lifetimes. `update()` moves them all and drops the dead ones in a few array operations.
+
+    Particles fade from `color` to `end_color` and from opaque to transparent over their lifetime.
+    That ramp is pre-rendered into `steps` sprites, so drawing is a single `Surface.blits()` call.
+
+    With `direct=True` (always on for `size` 1) the sprites are skipped and particles are written
+    straight into the surface's pixels as `size` x `size` squares. This is several times faster
+    for tens of thousands of particles, but they don't fade out (only the color ramp is used).
+
+    Lifetimes are in frames, speeds in pixels per frame, angles in degrees (0 is right, 90 is down).
+    Each of `lifetime`, `speed` and `angle` is a `(min, max)` range particles are spread across.
+
+    ``` python
+    sparks = ParticleSystem(color=(255, 200, 50), end_color=(255, 40, 0), speed=(1, 4), gravity=(0, 0.1))
+    sparks.emit(x, y, 200)                       # a burst
+    smoke = sparks.add_emitter(x, y, rate=30)    # a steady stream
+
+    # in update()
+    sparks.update()
+
+    # in draw()
+    sparks.draw(surface)
+    ```
+    """
+    def __init__(self, max_particles=20000, color=(255, 255, 255), end_color=None, size=3,
+                 lifetime=(30, 60), speed=(1, 3), angle=(0, 360), gravity=(0, 0), drag=0.0,
+                 steps=16, direct=False, seed=None):
+        self.max_particles = max_particles
+        self.color = color
+        self.end_color = end_color if end_color is not None else color
+        self.size = size
+        self.lifetime = lifetime
+        self.speed = speed
+        self.angle = angle
+        self.gravity = np.array(gravity, np.float32)
+        self.drag = drag
+        self.steps = steps
+        self.direct = direct or size <= 1
+        self.emitters = []
+        self.count = 0
+
+        self.pos = np.zeros((max_particles, 2), np.float32)
+        self.vel = np.zeros((max_particles, 2), np.float32)
+        self.age = np.zeros(max_particles, np.float32)
+        self.life = np.ones(max_particles, np.float32)
+
+        self._rng = np.random.default_rng(seed)
+        # Pre-rendered sprites of the color/alpha ramp by pixel size, at most `_MAX_SPRITE_SIZES` of them
+        self._sprites = {}
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, x, y, count):
+        """Spawn `count` particles at `x`, `y`. Particles past `max_particles` are dropped."""
+        start = self.count
+        count = min(int(count), self.max_particles - start)
+        if count <= 0:
+            return 0
+        end = start + count
+        rng = self._rng
+
+        angles = np.radians(rng.uniform(self.angle[0], self.angle[1], count))
+        speeds = rng.uniform(self.speed[0], self.speed[1], count)
+        self.pos[start:end] = (x, y)
+        self.vel[start:end, 0] = np.cos(angles) * speeds
+        self.vel[start:end, 1] = np.sin(angles) * speeds
+        self.age[start:end] = 0
+        self.life[start:end] = rng.uniform(self.lifetime[0], self.lifetime[1], count)
+        self.count = end
+        return count
+
+    def add_emitter(self, x, y, rate):
+        emitter = Emitter(x, y, rate)
+        self.emitters.append(emitter)
+        return emitter
+
+    def remove_emitter(self, emitter):
+        self.emitters.remove(emitter)
+
+    def clear(self):
+        self.count = 0
+
+    def update(self, dt=1.0):
+        """Spawn from the emitters, move every particle and remove the ones that died. `dt` is in frames."""
+        for emitter in self.emitters:
+            if emitter.active:
+                emitter._carry += emitter.rate * dt
+                spawn = int(emitter._carry)
+                if spawn:
+                    emitter._carry -= spawn
+                    self.emit(emitter.x, emitter.y, spawn)
+
+        n = self.count
+        if not n:
+            return
+
+        vel, age = self.vel[:n], self.age[:n]
+        if self.gravity.any():
+            vel += self.gravity * dt
+        if self.drag:
+            vel *= (1.0 - self.drag) ** dt
+        self.pos[:n] += vel * dt
+        age += dt
+
+        # Optimized: Dead particles are compacted away in one pass per array
+        alive = age < self.life[:n]
+        if not alive.all():
+            kept = int(alive.sum())
+            for array in (self.pos, self.vel, self.age, self.life):
+                array[:kept] = array[:n][alive]
+            self.count = kept
+
+    def _ramp(self):
+        """Return the `(steps, 4)` RGBA colors the particles go through."""
+        t = np.linspace(0.0, 1.0, self.steps)[:, None]
+        start = np.array(tuple(self.color)[:3] + (255,), np.float32)
+        end = np.array(tuple(self.end_color)[:3] + (0,), np.float32)
+        return (start + (end - start) * t).round().astype(np.uint8)
+
+    def _frames(self, zoom):
+        # Keyed by the rounded size, so an animated camera zoom reuses the same few sets of sprites
+        size = max(1, round(self.size * zoom))
+        frames = self._sprites.get(size)
+        if frames is None:
+            if len(self._sprites) >= _MAX_SPRITE_SIZES:
+                # Dicts keep insertion order, drop the oldest size
+                del self._sprites[next(iter(self._sprites))]
+            frames = []
+            for r, g, b, a in self._ramp().tolist():
+                sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+                pygame.draw.circle(sprite, (r, g, b, a), (size / 2, size / 2), size / 2)
+                frames.append(sprite)
+            self._sprites[size] = frames
+        return frames
+
+    def draw(self, surface, camera=None):
+        """Draw every particle that is on `surface`. With a `Camera`, particle positions are world coordinates."""
+        n = self.count
+        if not n:
+            return
+
+        pos = self.pos[:n]
+        zoom = 1.0
+        if camera is not None:
+            zoom = camera.zoom
+            pos = (pos - (camera.left, camera.top)) * zoom
+
+        steps = self.steps
+        frame = np.minimum((self.age[:n] / self.life[:n] * steps).astype(np.int32), steps - 1)
+
+        width, height = surface.get_size()
+        size = max(1, round(self.size * zoom))
+        topleft = (pos - size / 2).astype(np.int32)
+        if self.direct:
+            self._draw_pixels(surface, topleft, frame, size, width, height)
+            return
+
+        # Optimized: Culled in bulk, only particles that touch the surface become blits
+        x, y = topleft[:, 0], topleft[:, 1]
+        visible = (x > -size) & (x < width) & (y > -size) & (y < height)
+        if not visible.all():
+            topleft, frame = topleft[visible], frame[visible]
+        if not len(frame):
+            return
+
+        frames = self._frames(zoom)
+        surface.blits(zip(map(frames.__getitem__, frame.tolist()), topleft.tolist()), doreturn=False)
+
+        low, high = topleft.min(axis=0), topleft.max(axis=0)
+        _mark_dirty(surface, pygame.Rect(int(low[0]), int(low[1]), int(high[0] - low[0]) + size, int(high[1] - low[1]) + size))
+
+    def _draw_pixels(self, surface, topleft, frame, size, width, height):
+        # Squares that are only partly on the surface are skipped, so no write goes out of bounds
+        x, y = topleft[:, 0], topleft[:, 1]
+        visible = (x >= 0) & (x <= width - size) & (y >= 0) & (y <= height - size)
+        x, y, frame = x[visible], y[visible], frame[visible]
+        if not len(frame):
+            return
+
+        pixels = pygame.surfarray.pixels2d(surface)
+        colors = np.array([surface.map_rgb(c[:3]) for c in self._ramp().tolist()]).astype(pixels.dtype)[frame]
+        for dx in range(size):
+            for dy in range(size):
+                pixels[x + dx, y + dy] = colors
+        # The pixel array keeps the surface locked until it is gone
+        del pixels
+
+        _mark_dirty(surface, pygame.Rect(int(x.min()), int(y.min()), int(x.max() - x.min()) + size, int(y.max() - y.min()) + size))
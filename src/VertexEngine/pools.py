@@ -0,0 +1,131 @@
+"""This is the object pooling of VertexEngine. It reuses short-lived objects and surfaces instead of reallocating them."""
+import weakref
+import pygame
+
+# Every named pool, for `pool_stats()`
+_registry = weakref.WeakValueDictionary()
+
+class ObjectPool:
+    """
+    Keeps released objects around and hands them out again, so spawning bullets, particles, etc.
+    doesn't allocate a new object (and create garbage) every time.
+
+    `factory(*args, **kwargs)` creates a new object when the pool is empty. `reset(obj, *args, **kwargs)`
+    is called on a reused object with the same arguments, and must put it back into a fresh state.
+
+    ``` python
+    class Bullet:
+        def __init__(self, x, y):
+            self.x, self.y = x, y
+
+    def reset_bullet(bullet, x, y):
+        bullet.x, bullet.y = x, y
+
+    bullets = ObjectPool(Bullet, reset_bullet, name="bullets")
+    b = bullets.acquire(10, 20)
+    ...
+    bullets.release(b)
+    ```
+
+    Pools with a `name` show up in `GameEngine.pool_stats()`.
+    """
+    def __init__(self, factory, reset=None, max_size=1024, name=None):
+        self.factory = factory
+        self.reset = reset
+        self.max_size = max_size
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._free = []
+
+        if name is not None:
+            _registry[name] = self
+
+    def __len__(self):
+        """Number of objects waiting to be reused."""
+        return len(self._free)
+
+    def acquire(self, *args, **kwargs):
+        if self._free:
+            obj = self._free.pop()
+            if self.reset is not None:
+                self.reset(obj, *args, **kwargs)
+            self.hits += 1
+            return obj
+
+        self.misses += 1
+        return self.factory(*args, **kwargs)
+
+    def release(self, obj):
+        """Give `obj` back. It must not be used afterwards. Objects past `max_size` are dropped."""
+        if len(self._free) < self.max_size:
+            self._free.append(obj)
+
+    def prefill(self, count, *args, **kwargs):
+        """Create `count` objects up front, e.g. while loading a scene."""
+        while len(self._free) < min(count, self.max_size):
+            self._free.append(self.factory(*args, **kwargs))
+
+    def stats(self):
+        """Return `{"hits", "misses", "hit_rate", "free"}`."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "free": len(self),
+        }
+
+    def clear(self):
+        self._free.clear()
+
+class SurfacePool(ObjectPool):
+    """
+    An `ObjectPool` of `pygame.Surface`s, keyed by size and flags.
+
+    A reused surface still holds its old pixels, so fill or blit over all of it before using it.
+    Per-surface alpha and colorkey are cleared when it is released.
+
+    ``` python
+    temp = surfaces.acquire((64, 64), pygame.SRCALPHA)
+    ...
+    surfaces.release(temp)
+    ```
+    """
+    def __init__(self, max_per_size=8, name=None):
+        super().__init__(pygame.Surface, max_size=max_per_size, name=name)
+        # (width, height, flags) -> free surfaces
+        self._free = {}
+
+    def __len__(self):
+        return sum(len(free) for free in self._free.values())
+
+    def acquire(self, size, flags=0):
+        free = self._free.get((size[0], size[1], flags & pygame.SRCALPHA))
+        if free:
+            self.hits += 1
+            return free.pop()
+
+        self.misses += 1
+        return pygame.Surface(size, flags)
+
+    def release(self, surface):
+        # Clear these first, surface alpha also shows up as SRCALPHA in get_flags()
+        surface.set_alpha(None)
+        surface.set_colorkey(None)
+        w, h = surface.get_size()
+        free = self._free.setdefault((w, h, surface.get_flags() & pygame.SRCALPHA), [])
+        if len(free) < self.max_size:
+            free.append(surface)
+
+    def prefill(self, count, size, flags=0):
+        free = self._free.setdefault((size[0], size[1], flags & pygame.SRCALPHA), [])
+        while len(free) < min(count, self.max_size):
+            free.append(pygame.Surface(size, flags))
+
+def pool_stats():
+    """Return `{name: pool.stats()}` for every named pool that still exists."""
+    return {name: pool.stats() for name, pool in list(_registry.items())}
+
+# Shared by the engine (scene caches, fades) and free for scenes to use
+surfaces = SurfacePool(name="surfaces")
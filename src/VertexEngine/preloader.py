@@ -0,0 +1,143 @@
+"""This is the asset preloader of VertexEngine. It loads images, sounds and fonts in the background."""
+from concurrent.futures import ThreadPoolExecutor, wait
+import pygame
+from ._base import VertexScreen
+
+# How every kind of asset in a manifest is decoded (on a worker thread)
+_DECODERS = {
+    "images": pygame.image.load,
+    "sounds": pygame.mixer.Sound,
+    "fonts": lambda src: VertexScreen.Font(*src),
+}
+
+class PreloadJob:
+    """The progress of one `Preloader.load()` call.
+
+    `progress` goes from 0.0 to 1.0, `ready` is True once everything is resident, and `errors`
+    lists `(name, exception)` for every asset that failed to load.
+    """
+    def __init__(self, total, assets, audio, on_ready, on_progress):
+        self.total = total
+        self.loaded = 0
+        self.errors = []
+        self.assets = assets
+        self.audio = audio
+        self.on_ready = on_ready
+        self.on_progress = on_progress
+        # (kind, name, future) for every asset that hasn't been handed over yet
+        self._pending = []
+        # Name -> path of the sounds being loaded
+        self._sound_paths = {}
+
+    @property
+    def progress(self):
+        return self.loaded / self.total if self.total else 1.0
+
+    @property
+    def ready(self):
+        return self.loaded >= self.total
+
+    def _store(self, kind, name, value):
+        if kind == "images":
+            self.assets.images[name] = value
+        elif kind == "fonts":
+            self.assets.fonts[name] = value
+        else:
+            self.audio.sounds[name] = value
+            # So a later `load_sound(name, path)` knows it is already loaded
+            self.audio._paths[name] = self._sound_paths.get(name)
+
+class Preloader:
+    """
+    Decodes the assets of a manifest on a thread pool while the current scene keeps running.
+
+    A manifest is a dict like the one scenes declare in `Scene.asset_manifest`:
+
+    ``` python
+    {
+        "images": {"coin": "data/coin.png"},
+        "sounds": {"jump": "data/jump.wav"},
+        "fonts": {"title": ("data/title.ttf", 32)},
+    }
+    ```
+
+    Decoded assets are only handed to the `AssetManager` (images and fonts) and `AudioManager`
+    (sounds) in `poll()`, which `GameEngine` calls at the start of every frame on the GUI thread.
+    Callbacks run there too. Assets that are already loaded are skipped.
+
+    You normally use this through `GameEngine.preload()`.
+    """
+    def __init__(self, workers=4):
+        self.workers = workers
+        self._pool = None
+        self._jobs = []
+
+    def load(self, manifest, assets=None, audio=None, on_ready=None, on_progress=None):
+        """Start loading `manifest` (a dict, or a scene/scene class with `asset_manifest`) and return a `PreloadJob`.
+        `on_progress(progress)` is called after every asset, `on_ready()` once everything is resident."""
+        manifest = getattr(manifest, "asset_manifest", manifest) or {}
+
+        tasks = []
+        for kind, stores in (("images", assets and assets.images), ("fonts", assets and assets.fonts),
+                             ("sounds", audio and audio.sounds)):
+            for name, src in manifest.get(kind, {}).items():
+                if stores is None:
+                    raise ValueError(f"Preloading {kind} needs an {'AudioManager' if kind == 'sounds' else 'AssetManager'}")
+                if name not in stores:
+                    tasks.append((kind, name, src))
+
+        job = PreloadJob(len(tasks), assets, audio, on_ready, on_progress)
+        self._jobs.append(job)
+
+        if tasks and self._pool is None:
+            self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="VertexEngine-Preload")
+
+        for kind, name, src in tasks:
+            if kind == "sounds":
+                job._sound_paths[name] = src
+            job._pending.append((kind, name, self._pool.submit(_DECODERS[kind], src)))
+
+        return job
+
+    def poll(self):
+        """Hand finished assets to their managers and run callbacks. Must be called on the GUI thread."""
+        if not self._jobs:
+            return
+
+        for job in tuple(self._jobs):
+            # Optimized: Worker threads never touch the managers, only finished decodes are handed over here
+            if job._pending:
+                pending = []
+                for item in job._pending:
+                    kind, name, future = item
+                    if not future.done():
+                        pending.append(item)
+                        continue
+                    try:
+                        job._store(kind, name, future.result())
+                    except Exception as e:
+                        print(f"[Warning] Couldn't preload '{name}': {e}")
+                        job.errors.append((name, e))
+
+                    job.loaded += 1
+                    if job.on_progress:
+                        job.on_progress(job.progress)
+                job._pending = pending
+
+            if job.ready:
+                self._jobs.remove(job)
+                if job.on_ready:
+                    job.on_ready()
+
+    def wait(self, job=None):
+        """Block until `job` (or every job) has finished decoding, then `poll()`."""
+        jobs = [job] if job is not None else list(self._jobs)
+        for j in jobs:
+            wait([future for _, _, future in j._pending])
+        self.poll()
+
+    def shutdown(self):
+        """Stop the worker threads, dropping anything that hasn't started loading yet."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,73 @@
+"""This is the frame profiler of VertexEngine. It records how long each part of a frame takes."""
+
+class FrameProfiler:
+    """
+    Records per-phase frame timings into a ring buffer of the last `size` frames.
+
+    Phases:
+    - `events`: mouse/keyboard event handling by the scenes
+    - `clear`: clearing the screen before drawing
+    - `update`: `Scene.update()` (all steps of the frame in fixed-timestep mode)
+    - `draw`: `Scene.draw()`
+    - `present`: painting the window (Qt paints after a frame is done, so it is counted in the next one)
+    - `frame`: the sum of all phases
+
+    You normally don't create this yourself, use `GameEngine.enable_profiler()` and
+    `GameEngine.frame_stats()` instead.
+    """
+    PHASES = ("events", "clear", "update", "draw", "present")
+
+    def __init__(self, size=300):
+        self.size = size
+        self.frames = 0
+        self._index = 0
+        self._samples = {phase: [0.0] * size for phase in self.PHASES + ("frame",)}
+        self._current = dict.fromkeys(self.PHASES, 0.0)
+
+    def add(self, phase, seconds):
+        """Add `seconds` to `phase` of the frame in progress."""
+        self._current[phase] += seconds
+
+    def end_frame(self):
+        """Store the frame in progress in the ring buffer and start a new one."""
+        current = self._current
+        i = self._index
+        total = 0.0
+        for phase, seconds in current.items():
+            self._samples[phase][i] = seconds
+            total += seconds
+            current[phase] = 0.0
+        self._samples["frame"][i] = total
+
+        self._index = (i + 1) % self.size
+        self.frames += 1
+
+    def samples(self, phase):
+        """Return the recorded timings of `phase` in seconds, oldest first."""
+        ring = self._samples[phase]
+        if self.frames < self.size:
+            return ring[:self.frames]
+        return ring[self._index:] + ring[:self._index]
+
+    def percentile(self, phase, p):
+        """Return the `p`th percentile (0 to 100) of `phase` in seconds."""
+        values = sorted(self.samples(phase))
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, round(p / 100 * (len(values) - 1)))]
+
+    def summary(self):
+        """Return `{phase: {"p50", "p95", "p99", "max"}}` with every value in milliseconds."""
+        return {
+            phase: {
+                "p50": self.percentile(phase, 50) * 1000,
+                "p95": self.percentile(phase, 95) * 1000,
+                "p99": self.percentile(phase, 99) * 1000,
+                "max": self.percentile(phase, 100) * 1000,
+            }
+            for phase in self.PHASES + ("frame",)
+        }
+
+    def reset(self):
+        """Forget every recorded frame."""
+        self.__init__(self.size)
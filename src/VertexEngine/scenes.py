@@ -1,6 +1,12 @@
 # scenes/scene.py
 """This is the scene system of VertexEngine. It contains the Scene class, which is used as a scren for 1 state of a game."""
+import inspect
+import threading
+from collections import deque
+from PyQt6.QtWidgets import QWidget
+from . import _base
 from .Vertex import VWidget
+from .pools import surfaces
 
 class Scene(VWidget):
     """
@@ -26,7 +32,23 @@ class Scene(VWidget):
     # In your engine setup:
     engine.scene_manager.set_scene(MainMenuScene(engine)) # Switch to the main menu scene, you can also use a variable to store the scene instance and reuse it later.
     ```
+
+    Mouse motion is sent to `handle_event` at most once per frame. Set `raw_mouse_motion = True`
+    on a scene that needs every mouse sample (drawing apps, for example).
+
+    Key presses reach a `Scene` through Qt focus (`keyPressEvent`) and the `Input` class. Set
+    `key_events = True` to also get them as `pygame.KEYDOWN`/`pygame.KEYUP` in `handle_event`.
+
+    A `Scene` is a full `QWidget`, so you can put Qt widgets on it. If a scene only draws on the
+    screen, `LightScene` is much cheaper to create and keep around.
     """
+    raw_mouse_motion = False
+    key_events = False
+
+    # Assets to load before the scene is created, see `GameEngine.preload()`. For example:
+    # {"images": {"coin": "coin.png"}, "sounds": {"jump": "jump.wav"}, "fonts": {"title": (None, 32)}}
+    asset_manifest = {}
+
     def __init__(self, engine):
         super().__init__(engine)  # parent = engine widget
         self.engine = engine
@@ -42,37 +64,432 @@ class Scene(VWidget):
         """Called when the scene is removed"""
         pass
 
+    def on_pause(self):
+        """Called when another scene is pushed on top of this one"""
+        pass
+
+    def on_resume(self):
+        """Called when this scene is back on top after the scene above it was popped"""
+        self.setFocus()
+
     def update(self):
         pass
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
+        """Draw the scene on `surface`.
+        When the engine runs with `fixed_timestep=True`, `alpha` is how far (0.0 to 1.0) the
+        current frame is between the last simulation step and the next one. Scenes can leave
+        `alpha` out of their `draw` and read `engine.alpha` instead."""
         pass
 
     def handle_event(self, event):
         pass
 
+    def on_resize(self, width, height):
+        """Called when the engine's screen changes size"""
+        pass
+
+    def snapshot(self):
+        """Only used with `GameEngine(threaded=True)`. Runs on the simulation thread after every
+        `update()` and returns everything `draw_snapshot()` needs. The returned value is shared
+        with the GUI thread, so it must never be changed afterwards."""
+        return None
+
+    def draw_snapshot(self, surface, snapshot):
+        """Only used with `GameEngine(threaded=True)`. Runs on the GUI thread and draws the latest
+        `snapshot()`. By default this just calls `draw(surface)`."""
+        self.draw(surface)
+
+class LightScene:
+    """
+    A scene that is a plain Python object instead of a `QWidget`. It has the same hooks as `Scene`,
+    but creating one costs next to nothing, so dozens can be built up front and kept in memory.
+    It can't hold Qt widgets; use `Scene` for that.
+
+    Input comes from the engine instead of Qt focus: keys arrive in `handle_event` as
+    `pygame.KEYDOWN`/`pygame.KEYUP` events (with the Qt key in `event.key`), next to the mouse events.
+
+    The base class only has an `engine` slot, so subclasses can declare `__slots__` for their own state:
+
+    ``` python
+    class Bullets(LightScene):
+        __slots__ = ("positions",)
+
+        def __init__(self, engine):
+            super().__init__(engine)
+            self.positions = []
+    ```
+    """
+    __slots__ = ("engine",)
+    raw_mouse_motion = False
+    key_events = True
+    asset_manifest = {}
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def on_enter(self):
+        """Called when the scene becomes active"""
+        # Take keyboard focus back from any Qt-backed scene
+        self.engine.setFocus()
+
+    def on_exit(self):
+        """Called when the scene is removed"""
+        pass
+
+    def on_pause(self):
+        """Called when another scene is pushed on top of this one"""
+        pass
+
+    def on_resume(self):
+        """Called when this scene is back on top after the scene above it was popped"""
+        self.engine.setFocus()
+
+    def update(self):
+        pass
+
+    def draw(self, surface, alpha=1.0):
+        """Draw the scene on `surface`, see `Scene.draw()`."""
+        pass
+
+    def handle_event(self, event):
+        pass
+
+    def on_resize(self, width, height):
+        """Called when the engine's screen changes size"""
+        pass
+
+    def snapshot(self):
+        """See `Scene.snapshot()`."""
+        return None
+
+    def draw_snapshot(self, surface, snapshot):
+        """See `Scene.draw_snapshot()`."""
+        self.draw(surface)
+
 # scenes/scene_manager.py
+
+# What a scene does while another scene is pushed on top of it
+LIVE = "live"            # keeps updating and drawing
+SUSPENDED = "suspended"  # stops updating, still draws every frame
+FROZEN = "frozen"        # stops updating, drawn once into a cached surface that is reblitted
+
+# Scene class -> whether its `draw` takes `alpha`
+_draw_takes_alpha = {}
+
+def _takes_alpha(scene):
+    cls = type(scene)
+    takes = _draw_takes_alpha.get(cls)
+    if takes is None:
+        # Optimized: The signature is only inspected once per scene class
+        positional = 0
+        takes = False
+        for param in inspect.signature(cls.draw).parameters.values():
+            if param.kind == param.VAR_POSITIONAL:
+                takes = True
+            elif param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+                positional += 1
+        # self, surface, alpha
+        takes = takes or positional >= 3
+        _draw_takes_alpha[cls] = takes
+    return takes
+
+def _draw_scene(scene, surface, alpha):
+    if alpha is None or not _takes_alpha(scene):
+        scene.draw(surface)
+    else:
+        scene.draw(surface, alpha)
+
+class _Layer:
+    """One entry of the scene stack."""
+    __slots__ = ("scene", "mode", "cache")
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.mode = LIVE
+        self.cache = None
+
 class SceneManager:
+    """
+    Keeps a stack of scenes. The top scene is the `current_scene`: it is always live and the only
+    one receiving events. Scenes below it keep running, stop, or become a cached picture depending
+    on the mode they were given when something was pushed on top (`LIVE`, `SUSPENDED` or `FROZEN`).
+
+    Scenes can also be registered by name with `add_scene()`, and every function that takes a
+    scene also accepts a registered name.
+
+    Every switch can `fade` over that many updates. The fade blends a snapshot of the last frame
+    over the new scene, so the old scene doesn't keep running during it.
+
+    Example usage:
+
+    ``` python
+    manager.add_scene("game", GameScene(engine))
+    manager.switch_to("game")
+    manager.push(PauseMenu(engine), below=FROZEN)  # game stops and is drawn from a cache
+    manager.pop(fade=15)                           # back to the game
+    ```
+
+    Qt widgets may only be shown and focused on the GUI thread, so stack changes asked for on any
+    other thread (a scene's `update()` with `GameEngine(threaded=True)`) are queued and applied by
+    the engine at the start of its next frame. `pop()` returns None in that case.
+    """
     def __init__(self):
-        self.current_scene = None
+        self.scenes = {}
+        self._stack = []
+        # Held while a scene updates or is switched, so a simulation thread never sees half a switch
+        self.lock = threading.RLock()
+
+        # Stack changes from other threads, applied on this one by `apply_pending()`
+        self._thread = threading.current_thread()
+        self._pending = deque()
+
+        # Cross-fade state: a copy of the last frame and how many updates it has left
+        self._screen = None
+        self._fade_surface = None
+        self._fade_left = 0
+        self._fade_total = 0
+
+        # Created on first use, so scenes that don't tween never need numpy
+        self._tweens = None
+
+    @property
+    def tweens(self):
+        """The `TweenManager` of these scenes, advanced once per update before the scenes update."""
+        if self._tweens is None:
+            from .tweens import TweenManager
+            self._tweens = TweenManager()
+        return self._tweens
+
+    @property
+    def current_scene(self):
+        """The scene on top of the stack, or None."""
+        return self._stack[-1].scene if self._stack else None
+
+    @property
+    def stack(self):
+        """The scenes on the stack, bottom first."""
+        return [layer.scene for layer in self._stack]
+
+    # ---------------------- REGISTRY ----------------------
+
+    def add_scene(self, name, scene):
+        """Register `scene` under `name`."""
+        self.scenes[name] = scene
+
+    def get_scene(self, name):
+        return self.scenes.get(name)
+
+    def remove_scene(self, name):
+        self.scenes.pop(name, None)
+
+    def switch_to(self, name, fade=0):
+        """Replace the whole stack with the scene registered as `name`."""
+        self.set_scene(name, fade)
+
+    def _resolve(self, scene):
+        if isinstance(scene, str):
+            if scene not in self.scenes:
+                raise KeyError(f"Unknown scene: {scene}")
+            return self.scenes[scene]
+        return scene
 
-    def set_scene(self, scene):
-        if self.current_scene:
-            self.current_scene.on_exit()
-            self.current_scene.hide()
+    # ---------------------- STACK ----------------------
 
-        self.current_scene = scene
-        self.current_scene.show()
-        self.current_scene.on_enter()
+    def _defer(self, method, *args):
+        """Queue `method(*args)` for `apply_pending()` if this isn't the GUI thread. Returns True if it was queued."""
+        if threading.current_thread() is self._thread:
+            return False
+        self._pending.append((method, args))
+        return True
+
+    def apply_pending(self):
+        """Apply the stack changes queued from other threads. The engine calls this every frame."""
+        pending = self._pending
+        while pending:
+            method, args = pending.popleft()
+            method(*args)
+
+    def set_scene(self, scene, fade=0):
+        """Exit every scene on the stack and make `scene` the only one."""
+        if self._defer(self.set_scene, scene, fade):
+            return
+        with self.lock:
+            scene = self._resolve(scene)
+            self._start_fade(fade)
+            while self._stack:
+                self._remove_top()
+            self._add_top(scene)
+
+    def push(self, scene, below=FROZEN, fade=0):
+        """Put `scene` on top. The old top scene becomes `below` (`LIVE`, `SUSPENDED` or `FROZEN`)."""
+        if self._defer(self.push, scene, below, fade):
+            return
+        with self.lock:
+            scene = self._resolve(scene)
+            self._start_fade(fade)
+            if self._stack:
+                top = self._stack[-1]
+                top.mode = below
+                self._drop_cache(top)
+                top.scene.on_pause()
+            self._add_top(scene)
+
+    def pop(self, fade=0):
+        """Exit the top scene and resume the one below it. Returns the removed scene."""
+        if self._defer(self.pop, fade):
+            return None
+        with self.lock:
+            if not self._stack:
+                return None
+            self._start_fade(fade)
+            scene = self._remove_top()
+            if self._stack:
+                top = self._stack[-1]
+                top.mode = LIVE
+                self._drop_cache(top)
+                top.scene.on_resume()
+            return scene
+
+    def replace(self, scene, fade=0):
+        """Exit the top scene and put `scene` in its place, leaving the rest of the stack alone."""
+        if self._defer(self.replace, scene, fade):
+            return
+        with self.lock:
+            scene = self._resolve(scene)
+            self._start_fade(fade)
+            if self._stack:
+                self._remove_top()
+            self._add_top(scene)
+
+    def _add_top(self, scene):
+        self._stack.append(_Layer(scene))
+        if isinstance(scene, QWidget):
+            scene.show()
+        scene.on_enter()
+
+    def _remove_top(self):
+        scene = self._stack.pop().scene
+        scene.on_exit()
+        if isinstance(scene, QWidget):
+            scene.hide()
+        return scene
+
+    def _start_fade(self, fade):
+        if fade > 0 and self._screen is not None:
+            self._end_fade()
+            self._fade_surface = self._copy(self._screen)
+            self._fade_left = self._fade_total = fade
+
+    def _end_fade(self):
+        if self._fade_surface is not None:
+            surfaces.release(self._fade_surface)
+            self._fade_surface = None
+        self._fade_left = 0
+
+    def _copy(self, surface):
+        # Optimized: Cached pictures come from the shared surface pool instead of a new copy() each time
+        copy = surfaces.acquire(surface.get_size())
+        copy.blit(surface, (0, 0))
+        return copy
+
+    def _drop_cache(self, layer):
+        if layer.cache is not None:
+            surfaces.release(layer.cache)
+            layer.cache = None
+
+    # ---------------------- FRAME ----------------------
 
     def _update(self):
-        if self.current_scene:
-            self.current_scene.update()
+        if self._tweens is not None:
+            self._tweens.update()
+
+        # Copy, scenes may push or pop from inside update()
+        for layer in tuple(self._stack):
+            if layer.mode == LIVE:
+                layer.scene.update()
 
-    def draw(self, surface):
-        if self.current_scene:
-            self.current_scene.draw(surface)
+        # Only counted down here, the fade surface belongs to the drawing thread and is released there
+        if self._fade_left:
+            self._fade_left -= 1
+
+    @staticmethod
+    def _first_drawn(layers):
+        """Index of the highest frozen layer with a cache (everything below it is covered), or -1."""
+        for i in range(len(layers) - 2, -1, -1):
+            layer = layers[i]
+            if layer.mode == FROZEN and layer.cache is not None:
+                return i
+        return -1
+
+    def snapshot(self):
+        """Return `((scene, scene.snapshot()), ...)` for every scene that still has to be drawn,
+        bottom first, or None if the stack is empty."""
+        layers = self._stack
+        if not layers:
+            return None
+        first = self._first_drawn(layers)
+        start = first + 1 if first >= 0 else 0
+        return tuple((layer.scene, layer.scene.snapshot()) for layer in layers[start:])
+
+    def draw_snapshot(self, surface, latest):
+        """Draw the stack from a value returned by `snapshot()`. Nothing is drawn until the top scene has one."""
+        if latest is None:
+            return
+        snapshots = {id(scene): snapshot for scene, snapshot in latest}
+        if not self._stack or id(self.current_scene) not in snapshots:
+            return
+
+        def draw_layer(scene):
+            # Scenes pushed below since the snapshot was taken are skipped for a frame
+            key = id(scene)
+            if key in snapshots:
+                scene.draw_snapshot(surface, snapshots[key])
+
+        self._draw_stack(surface, draw_layer)
+
+    def draw(self, surface, alpha=None):
+        """Draw the stack. `alpha` is only passed to scenes whose `draw` takes it."""
+        self._draw_stack(surface, lambda scene: _draw_scene(scene, surface, alpha))
+
+    def _draw_stack(self, surface, draw_layer):
+        self._screen = surface
+        layers = self._stack
+        if not layers:
+            return
+
+        # Optimized: Everything below the highest cached frozen scene is covered by its cache
+        start = self._first_drawn(layers)
+        if start >= 0:
+            # Full-screen blits aren't tracked by the dirty-rect system, report them by hand
+            _base._mark_dirty(surface, surface.blit(layers[start].cache, (0, 0)))
+        start += 1
+
+        for layer in layers[start:-1]:
+            draw_layer(layer.scene)
+            if layer.mode == FROZEN:
+                self._drop_cache(layer)
+                layer.cache = self._copy(surface)
+
+        draw_layer(layers[-1].scene)
+
+        if self._fade_surface is not None:
+            fade_left = self._fade_left
+            if fade_left:
+                self._fade_surface.set_alpha(255 * fade_left // self._fade_total)
+                _base._mark_dirty(surface, surface.blit(self._fade_surface, (0, 0)))
+            else:
+                self._end_fade()
 
     def handle_event(self, event):
-        if self.current_scene:
-            self.current_scene.handle_event(event)
\ No newline at end of file
+        with self.lock:
+            if self.current_scene:
+                self.current_scene.handle_event(event)
+
+    def resize(self, width, height):
+        with self.lock:
+            # Cached pictures have the old size, redraw them
+            self._end_fade()
+            for layer in self._stack:
+                self._drop_cache(layer)
+                layer.scene.on_resize(width, height)
@@ -0,0 +1,98 @@
+"""This is the background simulation of VertexEngine. It runs scene updates on their own thread."""
+import threading
+import time
+from collections import deque
+
+class SimulationThread(threading.Thread):
+    """
+    Runs `SceneManager._update()` on a worker thread at a fixed `hz`, so heavy game logic
+    doesn't block input and painting on the Qt GUI thread.
+
+    After every update the `snapshot()` of every scene on the stack that is drawn is stored in
+    `latest`. The GUI thread only ever reads `latest` and draws it with `Scene.draw_snapshot()`,
+    so a snapshot must never be changed after it is returned (use tuples, frozen copies, etc.).
+
+    Which scene hooks run where:
+    - Simulation thread: `update()`, `snapshot()`, `handle_event()` (events are queued by the engine)
+    - GUI thread: `draw_snapshot()`, `on_enter()`, `on_exit()`, `on_pause()`, `on_resume()`, `on_resize()`
+
+    `set_scene()`, `push()`, `pop()` and `replace()` called on the simulation thread are queued and
+    applied on the GUI thread at the start of its next frame.
+
+    You normally don't create this yourself, use `GameEngine(threaded=True)`.
+    """
+    def __init__(self, scene_manager, hz=60, max_steps=5):
+        super().__init__(name="VertexEngine-Simulation", daemon=True)
+        self.scene_manager = scene_manager
+        self.hz = hz
+        self.max_steps = max_steps
+
+        # Number of finished updates and the snapshot of the last one
+        self.frame = 0
+        self.latest = None
+
+        # Optimized: deque appends/pops are atomic, no lock needed to pass events over
+        self._events = deque()
+        self._running = threading.Event()
+        # Cleared while paused, see `pause()`
+        self._awake = threading.Event()
+        self._awake.set()
+
+    def post_event(self, event):
+        """Queue an event for the scenes, it is handled before the next update."""
+        self._events.append(event)
+
+    def start(self):
+        self._running.set()
+        super().start()
+
+    def pause(self):
+        """Stop updating after the current update, until `resume()`. The thread sleeps meanwhile."""
+        self._awake.clear()
+
+    def resume(self):
+        self._awake.set()
+
+    @property
+    def paused(self):
+        return not self._awake.is_set()
+
+    def stop(self, timeout=1.0):
+        """Ask the thread to finish and wait for it."""
+        self._running.clear()
+        # A paused thread has to wake up to notice
+        self._awake.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+
+    def run(self):
+        step = 1.0 / self.hz
+        next_time = time.perf_counter()
+        events = self._events
+        scene_manager = self.scene_manager
+
+        while self._running.is_set():
+            if not self._awake.is_set():
+                self._awake.wait()
+                # Don't try to catch up on the paused time
+                next_time = time.perf_counter()
+                continue
+
+            while events:
+                scene_manager.handle_event(events.popleft())
+
+            with scene_manager.lock:
+                scene_manager._update()
+                snapshot = scene_manager.snapshot()
+
+            # Optimized: Publishing is a single reference swap, the GUI thread never waits
+            self.latest = snapshot
+            self.frame += 1
+
+            next_time += step
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -step * self.max_steps:
+                # Too far behind to catch up, drop the missed time instead of spiralling
+                next_time = time.perf_counter()
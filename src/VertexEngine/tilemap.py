@@ -0,0 +1,208 @@
+"""This is the tilemap of VertexEngine. It stores tile layers in NumPy arrays and draws them from cached chunks (needs `numpy`)."""
+import math
+import numpy as np
+import pygame
+from ._base import _mark_dirty
+
+class Tilemap:
+    """
+    A grid of tiles with one or more layers, each one a `(rows, cols)` NumPy array of tile ids.
+    Id 0 is an empty tile.
+
+    `tileset` maps tile ids to what they look like: a `pygame.Surface` (blitted at the tile's
+    top-left corner) or an RGB(A) color (the tile is filled with it).
+
+    The map is split into chunks of `chunk_size` x `chunk_size` tiles. A chunk is rendered once
+    into a cached surface (all layers on top of each other) and only rendered again when one of its
+    tiles changes, so `draw()` costs one blit per visible chunk no matter how many tiles there are.
+
+    ``` python
+    level = Tilemap(200, 50, 32, {1: (90, 60, 30), 2: assets.get_image("grass")}, solid={1, 2})
+    level.fill(0, 40, 200, 10, 1)
+
+    # in draw()
+    level.draw(surface, camera=self.camera)
+
+    # in update()
+    if level.collides(player_rect):
+        ...
+    ```
+
+    Changing a layer array directly skips the cache bookkeeping; call `invalidate()` afterwards.
+    """
+    def __init__(self, cols, rows, tile_size, tileset, layers=1, chunk_size=16, solid=()):
+        self.cols = cols
+        self.rows = rows
+        self.tile_size = tile_size
+        self.tileset = dict(tileset)
+        self.chunk_size = chunk_size
+        self.layers = [np.zeros((rows, cols), np.uint16) for _ in range(layers)]
+
+        # Rendered chunks by (chunk_x, chunk_y); missing means it has to be rendered again
+        self._chunks = {}
+        # (chunk_x, chunk_y) -> (zoom, rendered chunk, scaled copy) for drawing with a zoomed camera
+        self._zoomed = {}
+        self._solid = np.zeros(1, bool)
+        self.set_solid(solid)
+
+    @property
+    def pixel_size(self):
+        return self.cols * self.tile_size, self.rows * self.tile_size
+
+    # ---------------------- TILES ----------------------
+
+    def get(self, col, row, layer=0):
+        """Return the tile id at `col`, `row`, or 0 outside the map."""
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return int(self.layers[layer][row, col])
+        return 0
+
+    def set(self, col, row, tile, layer=0):
+        """Set the tile id at `col`, `row`. Raises `IndexError` outside the map."""
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
+            raise IndexError(f"Tile {col}, {row} is outside the {self.cols}x{self.rows} map")
+        if self.layers[layer][row, col] != tile:
+            self.layers[layer][row, col] = tile
+            key = (col // self.chunk_size, row // self.chunk_size)
+            self._chunks.pop(key, None)
+            self._zoomed.pop(key, None)
+
+    def fill(self, col, row, width, height, tile, layer=0):
+        """Set every tile of a `width` x `height` block to `tile`."""
+        self.layers[layer][row:row + height, col:col + width] = tile
+        self.invalidate(col, row, width, height)
+
+    def load(self, tiles, col=0, row=0, layer=0):
+        """Copy a 2D array (or list of lists) of tile ids into the map at `col`, `row`."""
+        tiles = np.asarray(tiles, np.uint16)
+        height, width = tiles.shape
+        self.layers[layer][row:row + height, col:col + width] = tiles
+        self.invalidate(col, row, width, height)
+
+    def invalidate(self, col=0, row=0, width=None, height=None):
+        """Render the chunks that cover this block of tiles again on the next draw. A missing `width` or
+        `height` reaches the right or bottom edge of the map, so by default the whole map is redrawn."""
+        if width is None and height is None and col <= 0 and row <= 0:
+            self._chunks.clear()
+            self._zoomed.clear()
+            return
+        if width is None:
+            width = self.cols - col
+        if height is None:
+            height = self.rows - row
+
+        size = self.chunk_size
+        for cy in range(max(row, 0) // size, (min(row + height, self.rows) - 1) // size + 1):
+            for cx in range(max(col, 0) // size, (min(col + width, self.cols) - 1) // size + 1):
+                self._chunks.pop((cx, cy), None)
+                self._zoomed.pop((cx, cy), None)
+
+    def set_solid(self, tiles):
+        """Set which tile ids block movement in the collision queries."""
+        tiles = list(tiles)
+        # Lookup table indexed by tile id, so a whole block of tiles is checked in one step
+        self._solid = np.zeros(max(tiles + [max(self.tileset, default=0)]) + 1, bool)
+        self._solid[tiles] = True
+
+    # ---------------------- DRAWING ----------------------
+
+    def _render_chunk(self, cx, cy):
+        size, tile_size = self.chunk_size, self.tile_size
+        col, row = cx * size, cy * size
+        cols, rows = min(size, self.cols - col), min(size, self.rows - row)
+
+        surface = pygame.Surface((cols * tile_size, rows * tile_size), pygame.SRCALPHA)
+        tileset = self.tileset
+        for layer in self.layers:
+            block = layer[row:row + rows, col:col + cols]
+            blits = []
+            for y, x in zip(*np.nonzero(block)):
+                look = tileset.get(int(block[y, x]))
+                if look is None:
+                    continue
+                if isinstance(look, pygame.Surface):
+                    blits.append((look, (int(x) * tile_size, int(y) * tile_size)))
+                else:
+                    surface.fill(look, (int(x) * tile_size, int(y) * tile_size, tile_size, tile_size))
+            if blits:
+                surface.blits(blits, doreturn=False)
+        return surface
+
+    def draw(self, surface, offset=(0, 0), camera=None, static=False):
+        """Draw the part of the map that is visible on `surface`, with map pixel `offset` at its top-left corner.
+        With a `Camera`, its view (and zoom) is used instead of `offset`.
+        `static=True` doesn't report it in dirty-rect mode, for a map that doesn't scroll."""
+        zoom = 1.0
+        if camera is not None:
+            offset, zoom = (camera.left, camera.top), camera.zoom
+        ox, oy = offset
+        view_w, view_h = surface.get_size()
+        view_w, view_h = view_w / zoom, view_h / zoom
+        chunk_px = self.chunk_size * self.tile_size
+        chunks = self._chunks
+
+        # Optimized: Only the chunks overlapping the view are looked at
+        first_x, first_y = max(int(ox // chunk_px), 0), max(int(oy // chunk_px), 0)
+        last_x = min(int((ox + view_w - 1) // chunk_px), (self.cols - 1) // self.chunk_size)
+        last_y = min(int((oy + view_h - 1) // chunk_px), (self.rows - 1) // self.chunk_size)
+
+        blits = []
+        for cy in range(first_y, last_y + 1):
+            for cx in range(first_x, last_x + 1):
+                chunk = chunks.get((cx, cy))
+                if chunk is None:
+                    chunk = chunks[(cx, cy)] = self._render_chunk(cx, cy)
+                if zoom != 1:
+                    chunk = self._zoom_chunk(cx, cy, chunk, zoom)
+                blits.append((chunk, (round((cx * chunk_px - ox) * zoom), round((cy * chunk_px - oy) * zoom))))
+
+        if blits:
+            for rect in surface.blits(blits):
+                _mark_dirty(surface, rect, static)
+
+    def _zoom_chunk(self, cx, cy, chunk, zoom):
+        # The scaled copy is only reused for the same zoom of the very same rendered chunk
+        cached = self._zoomed.get((cx, cy))
+        if cached is not None and cached[0] == zoom and cached[1] is chunk:
+            return cached[2]
+        # Rounded up, so neighbouring chunks overlap by a pixel instead of leaving gaps
+        w, h = chunk.get_size()
+        scaled = pygame.transform.scale(chunk, (math.ceil(w * zoom) + 1, math.ceil(h * zoom) + 1))
+        self._zoomed[(cx, cy)] = (zoom, chunk, scaled)
+        return scaled
+
+    # ---------------------- COLLISION ----------------------
+
+    def tile_at(self, x, y, layer=0):
+        """Return the tile id under pixel `x`, `y`, or 0 outside the map."""
+        return self.get(int(x // self.tile_size), int(y // self.tile_size), layer)
+
+    def _solid_block(self, rect):
+        """Return the first column and row and the solid mask of the tiles overlapping `rect`."""
+        rect = pygame.Rect(rect)
+        ts = self.tile_size
+        col0, row0 = max(rect.left // ts, 0), max(rect.top // ts, 0)
+        col1, row1 = min((rect.right - 1) // ts, self.cols - 1), min((rect.bottom - 1) // ts, self.rows - 1)
+        if col1 < col0 or row1 < row0:
+            return col0, row0, np.zeros((0, 0), bool)
+
+        lut = self._solid
+        mask = np.zeros((row1 - row0 + 1, col1 - col0 + 1), bool)
+        for layer in self.layers:
+            block = layer[row0:row1 + 1, col0:col1 + 1]
+            mask |= lut[np.minimum(block, len(lut) - 1)] & (block < len(lut))
+        return col0, row0, mask
+
+    def is_solid(self, x, y):
+        """Return True if the tile under pixel `x`, `y` is solid on any layer."""
+        return bool(self._solid_block((int(x), int(y), 1, 1))[2].any())
+
+    def collides(self, rect):
+        """Return True if `rect` (in map pixels) overlaps any solid tile."""
+        return bool(self._solid_block(rect)[2].any())
+
+    def solid_rects(self, rect):
+        """Return a `pygame.Rect` for every solid tile overlapping `rect`."""
+        col0, row0, mask = self._solid_block(rect)
+        ts = self.tile_size
+        return [pygame.Rect((col0 + int(c)) * ts, (row0 + int(r)) * ts, ts, ts) for r, c in zip(*np.nonzero(mask))]
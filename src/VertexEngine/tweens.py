@@ -0,0 +1,174 @@
+"""This is the tween manager of VertexEngine. It animates attributes of many objects at once with NumPy (needs `numpy`)."""
+from itertools import compress
+import numpy as np
+
+def _out_bounce(t):
+    t = t * 1.0
+    out = np.empty_like(t)
+    a = t < 1 / 2.75
+    b = ~a & (t < 2 / 2.75)
+    c = ~a & ~b & (t < 2.5 / 2.75)
+    d = ~(a | b | c)
+    out[a] = 7.5625 * t[a] ** 2
+    out[b] = 7.5625 * (t[b] - 1.5 / 2.75) ** 2 + 0.75
+    out[c] = 7.5625 * (t[c] - 2.25 / 2.75) ** 2 + 0.9375
+    out[d] = 7.5625 * (t[d] - 2.625 / 2.75) ** 2 + 0.984375
+    return out
+
+# Easing functions by name, every one works on a whole array of progress values (0 to 1)
+EASINGS = {
+    "linear": lambda t: t,
+    "in_quad": lambda t: t * t,
+    "out_quad": lambda t: t * (2 - t),
+    "in_out_quad": lambda t: np.where(t < 0.5, 2 * t * t, 1 - (-2 * t + 2) ** 2 / 2),
+    "in_cubic": lambda t: t ** 3,
+    "out_cubic": lambda t: 1 - (1 - t) ** 3,
+    "in_out_cubic": lambda t: np.where(t < 0.5, 4 * t ** 3, 1 - (-2 * t + 2) ** 3 / 2),
+    "in_sine": lambda t: 1 - np.cos(t * np.pi / 2),
+    "out_sine": lambda t: np.sin(t * np.pi / 2),
+    "in_out_sine": lambda t: -(np.cos(np.pi * t) - 1) / 2,
+    "out_back": lambda t: 1 + 2.70158 * (t - 1) ** 3 + 1.70158 * (t - 1) ** 2,
+    "out_bounce": _out_bounce,
+}
+_EASING_IDS = {name: i for i, name in enumerate(EASINGS)}
+_EASING_FUNCS = list(EASINGS.values())
+
+class TweenManager:
+    """
+    Animates numeric attributes from their current value to a new one over a number of frames.
+
+    Every running tween is one row in a few NumPy arrays (start, end, elapsed, duration, easing),
+    so advancing thousands of them is a handful of array operations per easing in use. The results
+    are then written back with `setattr`.
+
+    Every `SceneManager` has one as `tweens`, updated once per tick before the scenes update:
+
+    ``` python
+    tweens = self.engine.scene_manager.tweens
+    tweens.tween(self.door, "y", 0, 30, easing="out_bounce")
+    tweens.to(self.title, 60, easing="out_back", x=400, y=120, on_complete=self.show_menu)
+    ```
+
+    Durations and delays are in frames (ticks with `fixed_timestep=True`). See `EASINGS` for the easing names.
+    """
+    def __init__(self):
+        self.start = np.zeros(0)
+        self.end = np.zeros(0)
+        self.elapsed = np.zeros(0)
+        self.duration = np.ones(0)
+        self.easing = np.zeros(0, np.int8)
+        self.ids = np.zeros(0, np.int64)
+        self._targets = []
+        self._attrs = []
+        # Completion callback (or None) of every tween
+        self._callbacks = []
+        self._next_id = 0
+
+        # Tweens added since the last update, appended to the arrays in one go
+        self._new = []
+
+    def __len__(self):
+        return len(self._targets) + len(self._new)
+
+    def tween(self, target, attr, end, duration, easing="linear", delay=0, on_complete=None):
+        """Animate `target.attr` to `end` over `duration` frames, after waiting `delay` frames.
+        The start value is read on the next `update()`. Returns an id for `cancel()`."""
+        if easing not in _EASING_IDS:
+            raise ValueError(f"Unknown easing '{easing}', use one of: {', '.join(EASINGS)}")
+        tween_id = self._next_id
+        self._next_id += 1
+        self._new.append((target, attr, end, max(duration, 1), _EASING_IDS[easing], delay, on_complete, tween_id))
+        return tween_id
+
+    def to(self, target, duration, easing="linear", delay=0, on_complete=None, **values):
+        """Animate several attributes of `target` together, e.g. `to(sprite, 30, x=100, y=50)`.
+        `on_complete` runs once, when all of them are done. Returns the tween ids."""
+        ids = []
+        last = len(values) - 1
+        for i, (attr, end) in enumerate(values.items()):
+            ids.append(self.tween(target, attr, end, duration, easing, delay, on_complete if i == last else None))
+        return ids
+
+    def cancel(self, tween_id):
+        """Stop a tween where it is, without calling its callback."""
+        self._new = [new for new in self._new if new[-1] != tween_id]
+        self._remove(self.ids == tween_id)
+
+    def cancel_target(self, target):
+        """Stop every tween of `target`."""
+        self._new = [new for new in self._new if new[0] is not target]
+        self._remove(np.fromiter((t is target for t in self._targets), bool, len(self._targets)))
+
+    def clear(self):
+        self._new.clear()
+        self._remove(np.ones(len(self._targets), bool))
+
+    def _add_new(self):
+        new = self._new
+        self._new = []
+        targets, attrs, ends, durations, easings, delays, callbacks, ids = zip(*new)
+        starts = list(map(getattr, targets, attrs))
+
+        self.start = np.concatenate((self.start, starts))
+        self.end = np.concatenate((self.end, ends))
+        # A delay is a negative head start on the elapsed time
+        self.elapsed = np.concatenate((self.elapsed, -np.asarray(delays, float)))
+        self.duration = np.concatenate((self.duration, durations))
+        self.easing = np.concatenate((self.easing, np.asarray(easings, np.int8)))
+        self.ids = np.concatenate((self.ids, ids))
+        self._targets.extend(targets)
+        self._attrs.extend(attrs)
+        self._callbacks.extend(callbacks)
+
+    def _remove(self, mask):
+        if not mask.any():
+            return
+        keep = ~mask
+        for name in ("start", "end", "elapsed", "duration", "easing", "ids"):
+            setattr(self, name, getattr(self, name)[keep])
+        keep = keep.tolist()
+        self._targets = list(compress(self._targets, keep))
+        self._attrs = list(compress(self._attrs, keep))
+        self._callbacks = list(compress(self._callbacks, keep))
+
+    def update(self, dt=1):
+        """Advance every tween by `dt` frames, write the values back and run the callbacks of finished ones."""
+        if self._new:
+            self._add_new()
+        if not self._targets:
+            return
+
+        elapsed = self.elapsed
+        elapsed += dt
+        progress = np.clip(elapsed / self.duration, 0.0, 1.0)
+
+        # Optimized: One vectorized call per easing in use, not one call per tween
+        easing = self.easing
+        first = easing[0]
+        if (easing == first).all():
+            eased = _EASING_FUNCS[first](progress)
+        else:
+            eased = np.empty_like(progress)
+            for easing_id in np.unique(easing).tolist():
+                rows = easing == easing_id
+                eased[rows] = _EASING_FUNCS[easing_id](progress[rows])
+        values = self.start + (self.end - self.start) * eased
+        # Finished tweens land exactly on their end value
+        done = elapsed >= self.duration
+        values[done] = self.end[done]
+
+        # Tweens still waiting for their delay leave the attribute alone
+        started = elapsed > 0
+        if started.all():
+            for _ in map(setattr, self._targets, self._attrs, values.tolist()):
+                pass
+        else:
+            flags = started.tolist()
+            for _ in map(setattr, compress(self._targets, flags), compress(self._attrs, flags), compress(values.tolist(), flags)):
+                pass
+
+        if done.any():
+            callbacks = [callback for callback in compress(self._callbacks, done.tolist()) if callback is not None]
+            self._remove(done)
+            for callback in callbacks:
+                callback()
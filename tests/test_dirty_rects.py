@@ -0,0 +1,62 @@
+import pygame
+
+from VertexEngine.engine import HeadlessEngine
+from VertexEngine.scenes import LightScene
+from VertexEngine import VertexScreen
+
+
+class HudScene(LightScene):
+    __slots__ = ("x",)
+
+    def __init__(self, engine):
+        super().__init__(engine)
+        self.x = 0
+
+    def update(self):
+        self.x += 1
+
+    def draw(self, surface):
+        draw = VertexScreen.Draw()
+        # Background and HUD are the same every frame
+        draw.rect(surface, (20, 20, 60), (0, 0, 800, 600), static=True)
+        draw.rect(surface, (200, 200, 200), (0, 560, 800, 40), static=True)
+        draw.rect(surface, (255, 0, 0), (self.x, 100, 10, 10))
+
+
+def _dirty_area(engine):
+    return sum(rect.w * rect.h for rect in engine._prev_dirty)
+
+
+def test_static_content_is_not_reported():
+    engine = HeadlessEngine(dirty_rects=True)
+    engine.scene_manager.set_scene(HudScene(engine))
+    engine.step(3)
+
+    # Only the moving 10x10 square is dirty, not the background or HUD
+    assert _dirty_area(engine) == 100
+    engine.step(30)
+    assert _dirty_area(engine) == 100
+
+
+def test_static_content_stays_on_screen():
+    engine = HeadlessEngine(dirty_rects=True, color=(0, 0, 0))
+    engine.scene_manager.set_scene(HudScene(engine))
+    engine.step(20)
+
+    # Where the square was is erased and the static background redrawn over it
+    assert engine.screen.get_at((5, 105)) == pygame.Color(20, 20, 60)
+    assert engine.screen.get_at((400, 580)) == pygame.Color(200, 200, 200)
+
+
+def test_covered_rects_are_not_reported_twice():
+    engine = HeadlessEngine(dirty_rects=True)
+    draw = VertexScreen.Draw()
+
+    class Covered(LightScene):
+        def draw(self, surface):
+            draw.rect(surface, (0, 0, 0), (0, 0, 100, 100))
+            draw.rect(surface, (255, 255, 255), (10, 10, 20, 20))
+
+    engine.scene_manager.set_scene(Covered(engine))
+    engine.step(2)
+    assert len(engine._prev_dirty) == 1